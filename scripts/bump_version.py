@@ -3,34 +3,38 @@ import subprocess
 import sys
 from pathlib import Path
 
+# (file, pattern, replacement template) for every place the version is pinned
+_VERSION_PATTERNS = [
+    (Path("pyproject.toml"), re.compile(r'^version = "[^"]+"', re.MULTILINE), 'version = "{v}"'),
+    (Path("nfpm.yml"), re.compile(r'^version: "[^"]+"', re.MULTILINE), 'version: "{v}"'),
+    (Path("PKGBUILD"), re.compile(r"^pkgver=.*", re.MULTILINE), "pkgver={v}"),
+    (
+        Path("sshive/__init__.py"),
+        re.compile(r'^__version__ = "[^"]+"', re.MULTILINE),
+        '__version__ = "{v}"',
+    ),
+    (
+        Path("sshive/main.py"),
+        re.compile(r'app\.setApplicationVersion\("[^"]+"\)', re.MULTILINE),
+        'app.setApplicationVersion("{v}")',
+    ),
+]
+
 
 def bump_version(new_version):
-    files_to_update = [
-        ("pyproject.toml", r'^version = "[^"]+"', f'version = "{new_version}"'),
-        ("nfpm.yml", r'^version: "[^"]+"', f'version: "{new_version}"'),
-        ("PKGBUILD", r"^pkgver=.*", f"pkgver={new_version}"),
-        (
-            "sshive/__init__.py",
-            r'^__version__ = "[^"]+"',
-            f'__version__ = "{new_version}"',
-        ),
-        (
-            "sshive/main.py",
-            r'app\.setApplicationVersion\("[^"]+"\)',
-            f'app.setApplicationVersion("{new_version}")',
-        ),
-    ]
-
-    for file_path, pattern, replacement in files_to_update:
-        path = Path(file_path)
+    for path, pattern, replacement in _VERSION_PATTERNS:
         if not path.exists():
-            print(f"Warning: {file_path} not found")
+            print(f"Warning: {path} not found")
             continue
 
         content = path.read_text()
-        new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+        new_content = pattern.sub(replacement.format(v=new_version), content)
+        if new_content == content:
+            print(f"Unchanged {path}")
+            continue
+
         path.write_text(new_content)
-        print(f"Updated {file_path}")
+        print(f"Updated {path}")
 
     # Update uv.lock
     print("Updating uv.lock...")
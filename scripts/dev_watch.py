@@ -1,17 +1,27 @@
 import os
+import signal
 import subprocess
 import sys
-import time
+import threading
 
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
+# Editors often emit several write/rename events per save; coalesce them
+RESTART_DEBOUNCE_SECONDS = 0.3
 
-class RestartHandler(FileSystemEventHandler):
+
+class RestartHandler(PatternMatchingEventHandler):
     def __init__(self, run_command, env=None):
+        super().__init__(
+            patterns=["*.py"],
+            ignore_patterns=["*/__pycache__/*", "*.pyc"],
+            ignore_directories=True,
+        )
         self.run_command = run_command
         self.env = env
         self.process = None
+        self._timer: threading.Timer | None = None
         self.start_app()
 
     def start_app(self):
@@ -27,11 +37,11 @@ class RestartHandler(FileSystemEventHandler):
         self.process = subprocess.Popen(self.run_command, env=self.env)
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
-        if event.src_path.endswith(".py"):
-            print(f"File changed: {event.src_path}. Restarting...")
-            self.start_app()
+        print(f"File changed: {event.src_path}. Restarting...")
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(RESTART_DEBOUNCE_SECONDS, self.start_app)
+        self._timer.start()
 
 
 if __name__ == "__main__":
@@ -41,6 +51,8 @@ if __name__ == "__main__":
     command = [sys.executable, "-m", "sshive.main"]
     env = os.environ.copy()
     env["PYTHONPATH"] = "."
+    # Stop the child writing .pyc files into the watched tree
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
 
     print(f"Watching directory '{path}' for changes...")
     event_handler = RestartHandler(command, env=env)
@@ -48,11 +60,14 @@ if __name__ == "__main__":
     observer.schedule(event_handler, path, recursive=True)
     observer.start()
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        observer.stop()
-        if event_handler.process:
-            event_handler.process.terminate()
+    # Block until Ctrl+C instead of waking up every second to poll
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    stop_event.wait()
+
+    observer.stop()
+    if event_handler._timer:
+        event_handler._timer.cancel()
+    if event_handler.process:
+        event_handler.process.terminate()
     observer.join()
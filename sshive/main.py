@@ -4,7 +4,11 @@ Main entry point for the application.
 """
 
 import argparse
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 
@@ -18,6 +22,7 @@ from sshive.ui.main_window import MainWindow
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
 def get_resource_path(filename: str) -> str:
     """Get path to resource file."""
     if getattr(sys, "frozen", False):
@@ -76,6 +81,25 @@ def _resolve_locale(settings: QSettings) -> str:
     return QLocale.system().name()
 
 
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue so the UI thread never waits on stderr.
+
+    Returns:
+        The started listener; stop it on shutdown to flush pending records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 def main():
     """Main application entry point."""
     # Parse command-line arguments
@@ -116,7 +140,10 @@ def main():
             sys.exit(0)  # Command sent successfully, exit this instance
         # If send fails, fall through to start a new instance
 
+    log_listener = _configure_logging()
+
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(log_listener.stop)
 
     # Use Fusion style for cross-platform consistency
     app.setStyle("Fusion")
@@ -135,7 +162,7 @@ def main():
 
     # Set application icon
     icon_path = get_resource_path("icon.png")
-    if Path(icon_path).exists():
+    if os.path.isfile(icon_path):
         app.setWindowIcon(QIcon(icon_path))
 
     # Start IPC server for receiving commands from other instances
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from uuid import uuid4
 
 
 @dataclass
@@ -22,7 +23,7 @@ class PortForward:
     local_port: int
     remote_port: int = 0  # 0 for dynamic proxies
     remote_bind_address: str = "localhost"
-    id: str = field(default_factory=lambda: __import__("uuid").uuid4().hex)
+    id: str = field(default_factory=lambda: uuid4().hex)
 
     def __post_init__(self):
         """Validate port forward data."""
@@ -54,7 +55,7 @@ class PortForward:
     def from_dict(cls, data: dict) -> "PortForward":
         """Create port forward from dictionary."""
         if not data.get("id"):
-            data["id"] = __import__("uuid").uuid4().hex
+            data["id"] = uuid4().hex
         return cls(
             id=data["id"],
             name=data["name"],
@@ -65,7 +66,7 @@ class PortForward:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SSHConnection:
     """Represents a single SSH connection configuration.
 
@@ -92,7 +93,11 @@ class SSHConnection:
     icon: str | None = None
     connection_type: str = "shell"  # "shell" or "tunnel"
     port_forwards: list[PortForward] = field(default_factory=list)
-    id: str = field(default_factory=lambda: __import__("uuid").uuid4().hex)
+    id: str = field(default_factory=lambda: uuid4().hex)
+    # (key_path, port, user, host) the cached argv was built from, and the argv itself
+    _ssh_argv: tuple[tuple, tuple[str, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate connection data."""
@@ -133,7 +138,7 @@ class SSHConnection:
         """Create connection from dictionary."""
         # Ensure ID exists (for backward compatibility)
         if not data.get("id"):
-            data["id"] = __import__("uuid").uuid4().hex
+            data["id"] = uuid4().hex
 
         # Parse port forwards if present
         port_forwards = []
@@ -154,23 +159,28 @@ class SSHConnection:
             port_forwards=port_forwards,
         )
 
+    @property
+    def ssh_argv(self) -> tuple[str, ...]:
+        """Base SSH command arguments, rebuilt only when the fields they use change."""
+        key = (self.key_path, self.port, self.user, self.host)
+        cached = self._ssh_argv
+        if cached is None or cached[0] != key:
+            argv = (
+                "ssh",
+                *(("-i", self.key_path) if self.key_path else ()),
+                *(("-p", str(self.port)) if self.port != 22 else ()),
+                f"{self.user}@{self.host}",
+            )
+            self._ssh_argv = cached = (key, argv)
+        return cached[1]
+
     def get_ssh_command(self) -> list[str]:
         """Generate base SSH command arguments.
 
         Returns:
             List of command arguments suitable for subprocess
         """
-        cmd = ["ssh"]
-
-        if self.key_path:
-            cmd.extend(["-i", self.key_path])
-
-        if self.port != 22:
-            cmd.extend(["-p", str(self.port)])
-
-        cmd.append(f"{self.user}@{self.host}")
-
-        return cmd
+        return list(self.ssh_argv)
 
     def get_tunnel_command(self) -> list[str]:
         """Generate SSH tunnel command with all port forwards.
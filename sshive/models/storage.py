@@ -1,6 +1,9 @@
 """Storage module for SSH connections."""
 
 import json
+import os
+import shutil
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -9,6 +12,25 @@ import platformdirs
 from sshive.models.connection import SSHConnection
 from sshive.models.putty_importer import PuTTYImporter
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize storage payload as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ConnectionStorage:
     """Handles persistence of SSH connections to JSON file.
@@ -32,6 +54,14 @@ class ConnectionStorage:
             self.config_file = self._get_default_config_path()
 
         self.max_backups = max_backups
+
+        # Parsed connections plus the (mtime_ns, size) of the file they came from
+        self._cache: list[SSHConnection] | None = None
+        self._cache_stamp: tuple[int, int] | None = None
+        # Connection id -> position in the cached list
+        self._index: dict[str, int] = {}
+        self._groups: set[str] = set()
+
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize empty config if doesn't exist
@@ -44,14 +74,38 @@ class ConnectionStorage:
         config_dir = Path(platformdirs.user_config_dir("sshive"))
         return config_dir / "connections.json"
 
+    def _stat_stamp(self) -> tuple[int, int] | None:
+        """Return a cheap fingerprint of the config file, or None if unavailable."""
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _set_cache(self, connections: list[SSHConnection], stamp: tuple[int, int] | None) -> None:
+        """Remember parsed connections and index them by id."""
+        self._cache = list(connections)
+        self._cache_stamp = stamp
+        self._index = {}
+        for i, conn in enumerate(self._cache):
+            self._index.setdefault(conn.id, i)
+        self._groups = {conn.group for conn in self._cache if conn.group}
+
+    def _clear_cache(self) -> None:
+        """Forget any cached connections."""
+        self._cache = None
+        self._cache_stamp = None
+        self._index = {}
+        self._groups = set()
+
     def _load_data(self) -> dict:
         """Load raw storage JSON with defaults.
 
         Returns:
             Parsed storage payload with required keys.
         """
-        with open(self.config_file, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(self.config_file, "rb") as f:
+            data = _loads(f.read())
 
         if not isinstance(data, dict):
             raise ValueError("Storage file must contain a JSON object")
@@ -62,9 +116,28 @@ class ConnectionStorage:
         return data
 
     def _save_data(self, data: dict) -> None:
-        """Save full storage payload to disk."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        """Save full storage payload to disk.
+
+        Writes to a sibling temp file and swaps it into place so a crash
+        mid-write never leaves a truncated config behind. The swap happens
+        next to the symlink target, and the file keeps its permissions; a new
+        file is created owner-only since it may hold passwords.
+        """
+        target = self.config_file.resolve()
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                shutil.copymode(target, tmp)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
 
     def load_connections(self) -> list[SSHConnection]:
         """Load all connections from storage.
@@ -72,28 +145,71 @@ class ConnectionStorage:
         Returns:
             List of SSHConnection objects
         """
+        stamp = self._stat_stamp()
+        if self._cache is not None and stamp is not None and stamp == self._cache_stamp:
+            return list(self._cache)
+
         try:
-            data = self._load_data()
+            connections, needs_migration, stamp = self.read_connections()
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            self._clear_cache()
+            print(f"Error loading connections: {e}")
+            return []
+
+        return self._adopt(connections, needs_migration, stamp)
 
-            raw_connections = data.get("connections", [])
-            needs_migration = False
+    def read_connections(self) -> tuple[list[SSHConnection], bool, tuple[int, int] | None]:
+        """Parse the connections file without touching the cache.
 
-            # Check if migration is needed (missing IDs)
-            for conn_data in raw_connections:
-                if not conn_data.get("id"):
-                    needs_migration = True
-                    break
+        Only reads config_file, so it may run on a worker thread; hand the result
+        to adopt_connections on the thread that owns this storage.
 
-            connections = [SSHConnection.from_dict(conn_data) for conn_data in raw_connections]
+        Returns:
+            (connections, whether any need an ID migration, file stamp before reading)
+        """
+        stamp = self._stat_stamp()
+        data = self._load_data()
 
-            if needs_migration:
-                self.save_connections(connections)
+        connections = []
+        needs_migration = False
 
-            return connections
+        # Build connections in one pass, noting entries that need an ID migration
+        for conn_data in data.get("connections", []):
+            if not conn_data.get("id"):
+                needs_migration = True
+            connections.append(SSHConnection.from_dict(conn_data))
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Error loading connections: {e}")
-            return []
+        return connections, needs_migration, stamp
+
+    def adopt_connections(
+        self,
+        connections: list[SSHConnection],
+        needs_migration: bool,
+        stamp: tuple[int, int] | None,
+    ) -> list[SSHConnection]:
+        """Cache connections parsed by read_connections, migrating them if needed.
+
+        Falls back to load_connections if the file changed after it was read.
+
+        Returns:
+            List of SSHConnection objects
+        """
+        if stamp is None or stamp != self._stat_stamp():
+            return self.load_connections()
+        return self._adopt(connections, needs_migration, stamp)
+
+    def _adopt(
+        self,
+        connections: list[SSHConnection],
+        needs_migration: bool,
+        stamp: tuple[int, int] | None,
+    ) -> list[SSHConnection]:
+        """Save migrated connections, or cache them as read."""
+        if needs_migration:
+            self.save_connections(connections)
+        else:
+            self._set_cache(connections, stamp)
+        return connections
 
     def save_connections(self, connections: list[SSHConnection]) -> None:
         """Save all connections to storage.
@@ -108,7 +224,14 @@ class ConnectionStorage:
 
         data["version"] = "1.0"
         data["connections"] = [conn.to_dict() for conn in connections]
-        self._save_data(data)
+        try:
+            self._save_data(data)
+        except BaseException:
+            # load_connections hands out the cached objects, which callers may have
+            # edited in place; after a failed write only the file is trustworthy
+            self._clear_cache()
+            raise
+        self._set_cache(connections, self._stat_stamp())
 
         # Create automatic backup after saving changes
         self.create_auto_backup()
@@ -130,17 +253,13 @@ class ConnectionStorage:
             connection: SSHConnection with updated data
         """
         connections = self.load_connections()
-        found = False
 
-        # Find and replace connection with matching ID
-        for i, conn in enumerate(connections):
-            if conn.id == connection.id:
-                connections[i] = connection
-                found = True
-                break
-
-        if not found:
+        # load_connections() returns the cached order, so the id index applies
+        index = self._index.get(connection.id) if self._cache is not None else None
+        if index is None:
             connections.append(connection)
+        else:
+            connections[index] = connection
 
         self.save_connections(connections)
 
@@ -151,6 +270,7 @@ class ConnectionStorage:
             connection_id: ID of connection to delete
         """
         connections = self.load_connections()
+        # Filter rather than use the id index: imports can leave duplicate ids behind
         connections = [conn for conn in connections if conn.id != connection_id]
         self.save_connections(connections)
 
@@ -171,9 +291,9 @@ class ConnectionStorage:
         Returns:
             Sorted list of group names
         """
-        connections = self.load_connections()
-        groups = {conn.group for conn in connections if conn.group}
-        return sorted(groups)
+        if self._cache is None or self._stat_stamp() != self._cache_stamp:
+            self.load_connections()
+        return sorted(self._groups)
 
     def get_recent_connections(self, limit: int = 10) -> list[dict]:
         """Return recent connection usage entries in newest-first order."""
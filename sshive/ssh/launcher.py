@@ -1,15 +1,103 @@
 """SSH connection launcher with terminal detection."""
 
+import functools
+import logging
 import os
+import shlex
 import shutil
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from PySide6.QtCore import QCoreApplication, QTimer
+
 from sshive.models.connection import SSHConnection
 
+logger = logging.getLogger(__name__)
+
+# Variables PyInstaller rewrites for the bundle; restored before spawning children
+_FROZEN_ENV_VARS = ("LD_LIBRARY_PATH", "PYTHONPATH", "PYTHONHOME", "QT_PLUGIN_PATH")
+
+# Terminal command templates per platform, in preference order; macOS is probed in get_terminals
+_TERMINALS: dict[str, dict[str, tuple[str, ...]]] = {
+    "win32": {
+        "wt": ("wt.exe",),
+        "cmd": ("cmd", "/c", "start"),
+    },
+    "linux": {
+        "konsole": ("konsole", "-e"),
+        "gnome-terminal": ("gnome-terminal", "--"),
+        "xfce4-terminal": ("xfce4-terminal", "-e"),
+        "alacritty": ("alacritty", "-e"),
+        "kitty": ("kitty",),
+        "tilix": ("tilix", "-e"),
+        "terminator": ("terminator", "-e"),
+        "xterm": ("xterm", "-e"),
+    },
+}
+
+_FALLBACK_TERMINAL: tuple[str, tuple[str, ...]] = ("xterm", ("xterm", "-e"))
+
+
+def _append_command(terminal_cmd: list[str], ssh_cmd: list[str]) -> list[str]:
+    """Run ssh directly as the terminal's command."""
+    return terminal_cmd + ssh_cmd
+
+
+def _bash_wrapped_command(terminal_cmd: list[str], ssh_cmd: list[str]) -> list[str]:
+    """Run ssh under bash and keep the window open if the connection fails."""
+    wrapped_cmd = f"{shlex.join(ssh_cmd)} || {{ echo -v; echo '----------------------------------------'; echo 'Connection failed or closed.'; read -p 'Press Enter to close...'; }}"
+    return terminal_cmd + ["bash", "-c", wrapped_cmd]
+
+
+def _applescript_command_string(ssh_cmd: list[str]) -> str:
+    """Join ssh arguments for embedding in a double-quoted AppleScript string."""
+    return " ".join([f'"{arg}"' if " " in arg else arg for arg in ssh_cmd])
+
+
+def _iterm_command(terminal_cmd: list[str], ssh_cmd: list[str]) -> list[str]:
+    """Open a new iTerm window (or tab) running ssh via AppleScript."""
+    ssh_script = _applescript_command_string(ssh_cmd)
+    osa_script = (
+        'tell application "iTerm"\n'
+        "    try\n"
+        f'        set newWindow to (create window with default profile command "{ssh_script}")\n'
+        "    on error\n"
+        f'        tell current window to create tab with default profile command "{ssh_script}"\n'
+        "    end try\n"
+        "    activate\n"
+        "end tell"
+    )
+    return ["osascript", "-e", osa_script]
+
+
+def _terminal_app_command(terminal_cmd: list[str], ssh_cmd: list[str]) -> list[str]:
+    """Run ssh in Terminal.app via AppleScript."""
+    ssh_script = _applescript_command_string(ssh_cmd)
+    osa_script = (
+        f'tell application "Terminal"\n    do script "{ssh_script}"\n    activate\nend tell'
+    )
+    return ["osascript", "-e", osa_script]
+
+
+# Terminals whose launch command isn't simply "template + ssh argv" (non-Windows only)
+_COMMAND_BUILDERS = {
+    "konsole": _bash_wrapped_command,
+    "gnome-terminal": _bash_wrapped_command,
+    "xfce4-terminal": _bash_wrapped_command,
+    "alacritty": _bash_wrapped_command,
+    "tilix": _bash_wrapped_command,
+    "terminator": _bash_wrapped_command,
+    "xterm": _bash_wrapped_command,
+    "iTerm": _iterm_command,
+    "Terminal": _terminal_app_command,
+}
+
 
 class SSHLauncher:
     """Handles launching SSH connections in appropriate terminal emulators."""
@@ -32,6 +120,23 @@ class SSHLauncher:
         "offending ",
     )
 
+    # Executable name -> path for lookups that succeeded; misses are always retried
+    _which_cache: dict[str, str] = {}
+
+    # preferred_terminal -> (terminal_name, command_template) from detect_terminal
+    _terminal_cache: dict[str, tuple[str, Sequence[str]]] = {}
+
+    # (ppk_path, mtime_ns) -> converted OpenSSH key bytes; kept in memory, never on disk
+    _ppk_cache: dict[tuple[str, int], bytes] = {}
+
+    @staticmethod
+    def clear_caches() -> None:
+        """Forget cached executable lookups, terminal detection and PPK conversions."""
+        SSHLauncher._which_cache.clear()
+        SSHLauncher._macos_app_exists.cache_clear()
+        SSHLauncher._terminal_cache.clear()
+        SSHLauncher._ppk_cache.clear()
+
     @staticmethod
     def _which(name: str) -> str | None:
         """Find an executable by name, augmenting PATH in frozen builds.
@@ -45,7 +150,22 @@ class SSHLauncher:
         This helper first tries the normal ``shutil.which`` lookup and, if
         that fails *and* we are in a frozen build, retries with extra paths
         appended.
+
+        Found paths are cached; misses are not, so a tool installed while the
+        app is running is picked up on the next lookup.
         """
+        cached = SSHLauncher._which_cache.get(name)
+        if cached is not None:
+            return cached
+
+        result = SSHLauncher._find_executable(name)
+        if result:
+            SSHLauncher._which_cache[name] = result
+        return result
+
+    @staticmethod
+    def _find_executable(name: str) -> str | None:
+        """Uncached lookup behind _which."""
         result = shutil.which(name)
         if result:
             return result
@@ -70,47 +190,39 @@ class SSHLauncher:
         The keys are terminal names, the values are command templates (list of args).
         """
         if sys.platform == "darwin":
-
-            def _macos_app_exists(app_name):
-                try:
-                    subprocess.run(
-                        ["open", "-Ra", app_name],
-                        check=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-                    return True
-                except Exception:
-                    return False
-
             terminals = {}
-            if _macos_app_exists("iTerm"):
+            if SSHLauncher._macos_app_exists("iTerm"):
                 terminals["iTerm"] = ["open", "-a", "iTerm"]
-            if _macos_app_exists("Terminal"):
+            if SSHLauncher._macos_app_exists("Terminal"):
                 terminals["Terminal"] = ["open", "-a", "Terminal"]
             if SSHLauncher._which("alacritty"):
                 terminals["alacritty"] = ["alacritty", "-e"]
-            elif _macos_app_exists("Alacritty"):
+            elif SSHLauncher._macos_app_exists("Alacritty"):
                 alacritty_bin = "/Applications/Alacritty.app/Contents/MacOS/alacritty"
                 if Path(alacritty_bin).exists():
                     terminals["alacritty"] = [alacritty_bin, "-e"]
             return terminals
-        elif sys.platform == "win32":
-            return {
-                "wt": ["wt.exe"],
-                "cmd": ["cmd", "/c", "start"],
-            }
-        else:
-            return {
-                "konsole": ["konsole", "-e"],
-                "gnome-terminal": ["gnome-terminal", "--"],
-                "xfce4-terminal": ["xfce4-terminal", "-e"],
-                "alacritty": ["alacritty", "-e"],
-                "kitty": ["kitty"],
-                "tilix": ["tilix", "-e"],
-                "terminator": ["terminator", "-e"],
-                "xterm": ["xterm", "-e"],
-            }
+        return {name: list(cmd) for name, cmd in SSHLauncher._platform_terminals().items()}
+
+    @staticmethod
+    def _platform_terminals() -> dict[str, tuple[str, ...]]:
+        """Return the shared terminal templates for non-macOS platforms (do not mutate)."""
+        return _TERMINALS.get(sys.platform, _TERMINALS["linux"])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _macos_app_exists(app_name: str) -> bool:
+        """Return True if Launch Services knows about the named macOS app."""
+        try:
+            subprocess.run(
+                ["open", "-Ra", app_name],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            return True
+        except Exception:
+            return False
 
     @staticmethod
     def _convert_ppk_key(key_path: str, prefix: str = "sshive_key_") -> str | None:
@@ -129,6 +241,32 @@ class SSHLauncher:
         if not key_path.lower().endswith(".ppk") or sys.platform == "win32":
             return None
 
+        expanded_key_path = os.path.expanduser(key_path)
+        try:
+            mtime = os.stat(expanded_key_path).st_mtime_ns
+        except OSError:
+            return None
+
+        # puttygen runs once per revision of the key; each caller still gets its own file
+        cache_key = (expanded_key_path, mtime)
+        converted = SSHLauncher._ppk_cache.get(cache_key)
+        if converted is None:
+            converted = SSHLauncher._run_puttygen(expanded_key_path, prefix)
+            if converted is None:
+                return None
+            for stale_key in [k for k in SSHLauncher._ppk_cache if k[0] == expanded_key_path]:
+                del SSHLauncher._ppk_cache[stale_key]
+            SSHLauncher._ppk_cache[cache_key] = converted
+
+        # mkstemp creates the file readable by the owner only, as ssh requires
+        fd, temp_key_path = tempfile.mkstemp(prefix=prefix, suffix=".key")
+        with os.fdopen(fd, "wb") as f:
+            f.write(converted)
+        return temp_key_path
+
+    @staticmethod
+    def _run_puttygen(ppk_path: str, prefix: str) -> bytes | None:
+        """Return ppk_path converted to an OpenSSH private key, or None on failure."""
         puttygen = SSHLauncher._which("puttygen")
         if not puttygen:
             return None
@@ -139,33 +277,81 @@ class SSHLauncher:
         os.unlink(temp_key_path)
 
         try:
-            expanded_key_path = os.path.expanduser(key_path)
             # Run puttygen to convert the key
             result = subprocess.run(
-                [puttygen, expanded_key_path, "-O", "private-openssh", "-o", temp_key_path],
+                [puttygen, ppk_path, "-O", "private-openssh", "-o", temp_key_path],
                 check=False,
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
 
-            # If conversion failed or file not created, clean up and return None
+            # If conversion failed or file not created, treat as failure
             if result.returncode != 0 or not os.path.exists(temp_key_path):
-                if os.path.exists(temp_key_path):
-                    os.unlink(temp_key_path)
                 return None
 
+            with open(temp_key_path, "rb") as f:
+                converted = f.read()
             # If file is empty, treat as failure
-            if os.path.getsize(temp_key_path) == 0:
-                os.unlink(temp_key_path)
-                return None
-
-            return temp_key_path
+            return converted or None
         except Exception as e:
-            print(f"PPK conversion failed: {e}")
-            if os.path.exists(temp_key_path):
-                os.unlink(temp_key_path)
+            logger.warning("PPK conversion failed: %s", e)
             return None
+        finally:
+            SSHLauncher._remove_file(temp_key_path)
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """Delete a file, ignoring errors if it is already gone."""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _schedule_temp_key_cleanup(temp_key: str, delay_ms: int = 5000) -> None:
+        """Delete a converted temp key once the spawned ssh has had time to read it.
+
+        Uses a Qt single-shot timer when an application is running so no
+        thread sits sleeping; falls back to a ``threading.Timer`` otherwise.
+        """
+
+        def cleanup():
+            SSHLauncher._remove_file(temp_key)
+
+        if QCoreApplication.instance() is not None:
+            QTimer.singleShot(delay_ms, cleanup)
+        else:
+            timer = threading.Timer(delay_ms / 1000, cleanup)
+            timer.daemon = True
+            timer.start()
+
+    @staticmethod
+    def _spawn_detached(cmd: list[str], env: dict[str, str] | None) -> None:
+        """Start a process in its own session with no stdio attached to ours.
+
+        No ``preexec_fn`` is passed, which lets CPython's POSIX backend spawn via
+        ``vfork`` rather than copying the page tables of this (large) Qt process.
+        In frozen builds the bundle's library paths are restored to the values
+        PyInstaller saved, so the child doesn't load our bundled libraries.
+        """
+        if getattr(sys, "frozen", False):
+            env = dict(os.environ if env is None else env)
+            for var in _FROZEN_ENV_VARS:
+                orig_var = f"{var}_ORIG"
+                if orig_var in env:
+                    env[var] = env[orig_var]
+                else:
+                    env.pop(var, None)
+
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            env=env,
+        )
 
     @staticmethod
     def detect_terminal(preferred_terminal: str = "auto") -> tuple[str, list[str]]:
@@ -179,7 +365,25 @@ class SSHLauncher:
             Tuple of (terminal_name, command_template). The command_template is a list of command arguments to launch the terminal,
             with the SSH command appended as needed. If no preferred or detected terminal is found, defaults to xterm.
         """
-        terminals = SSHLauncher.get_terminals()
+        cached = SSHLauncher._terminal_cache.get(preferred_terminal)
+        if cached is None:
+            cached = SSHLauncher._detect_terminal_uncached(preferred_terminal)
+            # Like _which, remember only hits: a missing preferred terminal or the bare
+            # fallback is probed again next time in case it has since been installed
+            auto = not preferred_terminal or preferred_terminal == "auto"
+            if cached is not _FALLBACK_TERMINAL and (auto or cached[0] == preferred_terminal):
+                SSHLauncher._terminal_cache[preferred_terminal] = cached
+
+        name, cmd = cached
+        return name, list(cmd)
+
+    @staticmethod
+    def _detect_terminal_uncached(preferred_terminal: str) -> tuple[str, Sequence[str]]:
+        """Probe the platform's terminals without consulting the cache."""
+        if sys.platform == "darwin":
+            terminals = SSHLauncher.get_terminals()
+        else:
+            terminals = SSHLauncher._platform_terminals()
 
         # If user has a preferred terminal, check if it's available
         if preferred_terminal and preferred_terminal != "auto":
@@ -197,7 +401,7 @@ class SSHLauncher:
                 return term_name, cmd_template
 
         # Fallback to xterm if nothing else is found
-        return "xterm", ["xterm", "-e"]
+        return _FALLBACK_TERMINAL
 
     @staticmethod
     def launch(connection: SSHConnection, preferred_terminal: str = "auto") -> bool:
@@ -226,7 +430,7 @@ class SSHLauncher:
             if connection.key_path:
                 converted = SSHLauncher._convert_ppk_key(connection.key_path, prefix="sshive_key_")
                 if converted:
-                    temp_key = Path(converted)
+                    temp_key = converted
                     for i, arg in enumerate(ssh_cmd):
                         if (
                             arg == "-i"
@@ -236,12 +440,13 @@ class SSHLauncher:
                             ssh_cmd[i + 1] = converted
                             break
 
-            env = os.environ.copy()
+            # None inherits our environment; only build a dict when something changes
+            env: dict[str, str] | None = None
 
             if connection.password:
                 if sys.platform != "win32":
                     if SSHLauncher._which("sshpass"):
-                        env["SSHPASS"] = connection.password
+                        env = {**os.environ, "SSHPASS": connection.password}
                         ssh_cmd = ["sshpass", "-e"] + ssh_cmd
                 else:
                     plink = SSHLauncher._which("plink.exe") or SSHLauncher._which("klink.exe")
@@ -253,91 +458,21 @@ class SSHLauncher:
                             ssh_cmd.extend(["-P", str(connection.port)])
                         ssh_cmd.append(f"{connection.user}@{connection.host}")
 
-            if (
-                terminal_name
-                in [
-                    "konsole",
-                    "gnome-terminal",
-                    "xfce4-terminal",
-                    "alacritty",
-                    "tilix",
-                    "terminator",
-                    "xterm",
-                ]
-                and sys.platform != "win32"
-            ):
-                cmd_str = " ".join([f'"{arg}"' if " " in arg else arg for arg in ssh_cmd])
-                wrapped_cmd = f"{cmd_str} || {{ echo -v; echo '----------------------------------------'; echo 'Connection failed or closed.'; read -p 'Press Enter to close...'; }}"
-                full_cmd = terminal_cmd + ["bash", "-c", wrapped_cmd]
-
-            elif terminal_name in ["kitty"]:
-                full_cmd = terminal_cmd + ssh_cmd
-
-            elif terminal_name == "wt":
-                full_cmd = terminal_cmd + ssh_cmd
-
-            elif terminal_name == "iTerm":
-                ssh_script = " ".join([f'"{arg}"' if " " in arg else arg for arg in ssh_cmd])
-                osa_script = (
-                    'tell application "iTerm"\n'
-                    "    try\n"
-                    f'        set newWindow to (create window with default profile command "{ssh_script}")\n'
-                    "    on error\n"
-                    f'        tell current window to create tab with default profile command "{ssh_script}"\n'
-                    "    end try\n"
-                    "    activate\n"
-                    "end tell"
-                )
-                full_cmd = ["osascript", "-e", osa_script]
-
-            elif terminal_name == "Terminal":
-                ssh_script = " ".join([f'"{arg}"' if " " in arg else arg for arg in ssh_cmd])
-                osa_script = (
-                    'tell application "Terminal"\n'
-                    f'    do script "{ssh_script}"\n'
-                    "    activate\n"
-                    "end tell"
-                )
-                full_cmd = ["osascript", "-e", osa_script]
+            if sys.platform == "win32":
+                build_command = _append_command
             else:
-                full_cmd = terminal_cmd + ssh_cmd
+                build_command = _COMMAND_BUILDERS.get(terminal_name, _append_command)
+            full_cmd = build_command(terminal_cmd, ssh_cmd)
 
-            if getattr(sys, "frozen", False):
-                for var in ["LD_LIBRARY_PATH", "PYTHONPATH", "PYTHONHOME", "QT_PLUGIN_PATH"]:
-                    orig_var = f"{var}_ORIG"
-                    if orig_var in env:
-                        env[var] = env[orig_var]
-                    else:
-                        env.pop(var, None)
-
-            subprocess.Popen(
-                full_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-                env=env,
-            )
+            SSHLauncher._spawn_detached(full_cmd, env)
 
             if temp_key:
-
-                def cleanup():
-                    import time
-
-                    time.sleep(5)
-                    try:
-                        if temp_key.exists():
-                            temp_key.unlink()
-                    except Exception:
-                        pass
-
-                import threading
-
-                threading.Thread(target=cleanup, daemon=True).start()
+                SSHLauncher._schedule_temp_key_cleanup(temp_key)
 
             return True
 
-        except Exception as e:
-            print(f"Failed to launch SSH connection: {e}")
+        except Exception:
+            logger.exception("Failed to launch SSH connection")
             return False
 
     @staticmethod
@@ -363,11 +498,11 @@ class SSHLauncher:
         try:
             tunnel_cmd = connection.get_tunnel_command()
 
-            env = os.environ.copy()
+            env: dict[str, str] | None = None
             if connection.password:
                 if sys.platform != "win32":
                     if SSHLauncher._which("sshpass"):
-                        env["SSHPASS"] = connection.password
+                        env = {**os.environ, "SSHPASS": connection.password}
                         tunnel_cmd = ["sshpass", "-e"] + tunnel_cmd
                     else:
                         return False, "Password authentication requires 'sshpass' to be installed."
@@ -383,7 +518,7 @@ class SSHLauncher:
                     connection.key_path, prefix="sshive_tunnel_"
                 )
                 if converted:
-                    temp_key = Path(converted)
+                    temp_key = converted
                     for i, arg in enumerate(tunnel_cmd):
                         if (
                             arg == "-i"
@@ -401,37 +536,10 @@ class SSHLauncher:
                         )
                     return False, "Failed to convert PPK key. Check file permissions and format."
 
-            if getattr(sys, "frozen", False):
-                for var in ["LD_LIBRARY_PATH", "PYTHONPATH", "PYTHONHOME", "QT_PLUGIN_PATH"]:
-                    orig_var = f"{var}_ORIG"
-                    if orig_var in env:
-                        env[var] = env[orig_var]
-                    else:
-                        env.pop(var, None)
-
-            subprocess.Popen(
-                tunnel_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-                env=env,
-            )
+            SSHLauncher._spawn_detached(tunnel_cmd, env)
 
             if temp_key:
-
-                def cleanup():
-                    import time
-
-                    time.sleep(5)
-                    try:
-                        if temp_key.exists():
-                            temp_key.unlink()
-                    except Exception:
-                        pass
-
-                import threading
-
-                threading.Thread(target=cleanup, daemon=True).start()
+                SSHLauncher._schedule_temp_key_cleanup(temp_key)
 
             return True, None
 
@@ -453,8 +561,8 @@ class SSHLauncher:
             return False, "SSH command ('ssh') not found in PATH."
 
         if connection.key_path:
-            key_path = Path(connection.key_path).expanduser()
-            if not key_path.exists():
+            # key_path is normally expanded already, but may have been edited in place
+            if not os.path.exists(os.path.expanduser(connection.key_path)):
                 return False, f"SSH key file doesn't exist: {connection.key_path}"
 
             if (
@@ -528,36 +636,25 @@ class SSHLauncher:
         if not host:
             return False, "Host is empty."
 
-        ping_available = SSHLauncher._which("ping") is not None
-        ping_ok: bool | None = None
-        ping_message = "Ping skipped (ping command not found)."
+        # Ping in the background while probing the SSH port, so the two waits overlap
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ping_future = None
+            if SSHLauncher._which("ping") is not None:
+                ping_future = pool.submit(SSHLauncher._ping_host, host, timeout_seconds)
 
-        if ping_available:
+            port_error: OSError | None = None
             try:
-                if sys.platform == "win32":
-                    ping_cmd = ["ping", "-n", "1", "-w", str(int(timeout_seconds * 1000)), host]
-                else:
-                    ping_cmd = ["ping", "-c", "1", "-W", str(max(1, int(timeout_seconds))), host]
-
-                ping_result = subprocess.run(
-                    ping_cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=max(1, timeout_seconds + 0.5),
-                )
-                ping_ok = ping_result.returncode == 0
-                if ping_ok:
-                    ping_message = "Ping successful."
-                else:
-                    ping_message = "Host did not respond to ping."
-            except Exception:
-                ping_ok = False
-                ping_message = "Ping failed to execute."
+                with socket.create_connection((host, connection.port), timeout=timeout_seconds):
+                    pass
+            except OSError as exc:
+                port_error = exc
 
-        try:
-            with socket.create_connection((host, connection.port), timeout=timeout_seconds):
-                pass
+            if ping_future is not None:
+                ping_ok, ping_message = ping_future.result()
+            else:
+                ping_ok, ping_message = None, "Ping skipped (ping command not found)."
 
+        if port_error is None:
             if ping_ok is False:
                 return True, (
                     f"SSH port {connection.port} is reachable, but ping failed. "
@@ -568,20 +665,41 @@ class SSHLauncher:
                 return True, f"Ping successful and SSH port {connection.port} is reachable."
 
             return True, f"SSH port {connection.port} is reachable. {ping_message}"
-        except OSError as exc:
-            if ping_ok is True:
-                return (
-                    False,
-                    f"Ping successful but SSH port {connection.port} is not reachable: {exc}",
-                )
 
-            if ping_ok is False:
-                return (
-                    False,
-                    f"Host did not respond to ping and SSH port {connection.port} is not reachable: {exc}",
-                )
+        if ping_ok is True:
+            return (
+                False,
+                f"Ping successful but SSH port {connection.port} is not reachable: {port_error}",
+            )
+
+        if ping_ok is False:
+            return (
+                False,
+                f"Host did not respond to ping and SSH port {connection.port} is not reachable: {port_error}",
+            )
 
-            return False, f"SSH port {connection.port} is not reachable: {exc}. {ping_message}"
+        return False, f"SSH port {connection.port} is not reachable: {port_error}. {ping_message}"
+
+    @staticmethod
+    def _ping_host(host: str, timeout_seconds: float) -> tuple[bool, str]:
+        """Send a single ping and return (responded, status_message)."""
+        try:
+            if sys.platform == "win32":
+                ping_cmd = ["ping", "-n", "1", "-w", str(int(timeout_seconds * 1000)), host]
+            else:
+                ping_cmd = ["ping", "-c", "1", "-W", str(max(1, int(timeout_seconds))), host]
+
+            ping_result = subprocess.run(
+                ping_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=max(1, timeout_seconds + 0.5),
+            )
+            if ping_result.returncode == 0:
+                return True, "Ping successful."
+            return False, "Host did not respond to ping."
+        except Exception:
+            return False, "Ping failed to execute."
 
     @staticmethod
     def collect_ssh_debug_log(connection: SSHConnection, timeout_seconds: float = 4.0) -> str:
@@ -618,8 +736,7 @@ class SSHLauncher:
 
             converted = SSHLauncher._convert_ppk_key(connection.key_path, prefix="sshive_debug_")
             if converted:
-                temp_key = Path(converted)
-                key_path = converted
+                key_path = temp_key = converted
 
             cmd.extend(["-i", key_path])
 
@@ -633,34 +750,28 @@ class SSHLauncher:
         ]
 
         try:
-            try:
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=timeout_seconds
-                )
-                body = [
-                    f"Return code: {result.returncode}",
-                    "",
-                    result.stderr or result.stdout or "",
-                ]
-                return "\n".join(header + body)
-            except subprocess.TimeoutExpired as exc:
-                stderr = (exc.stderr or "") if isinstance(exc.stderr, str) else ""
-                stdout = (exc.stdout or "") if isinstance(exc.stdout, str) else ""
-                body = [
-                    f"Timed out after {timeout_seconds:.1f}s",
-                    "",
-                    stderr or stdout or "No output captured before timeout.",
-                ]
-                return "\n".join(header + body)
-            except Exception as exc:
-                body = ["Failed to collect debug log.", "", str(exc)]
-                return "\n".join(header + body)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_seconds)
+            body = [
+                f"Return code: {result.returncode}",
+                "",
+                result.stderr or result.stdout or "",
+            ]
+            return "\n".join(header + body)
+        except subprocess.TimeoutExpired as exc:
+            stderr = (exc.stderr or "") if isinstance(exc.stderr, str) else ""
+            stdout = (exc.stdout or "") if isinstance(exc.stdout, str) else ""
+            body = [
+                f"Timed out after {timeout_seconds:.1f}s",
+                "",
+                stderr or stdout or "No output captured before timeout.",
+            ]
+            return "\n".join(header + body)
+        except Exception as exc:
+            body = ["Failed to collect debug log.", "", str(exc)]
+            return "\n".join(header + body)
         finally:
-            if temp_key and temp_key.exists():
-                try:
-                    temp_key.unlink()
-                except Exception:
-                    pass
+            if temp_key:
+                SSHLauncher._remove_file(temp_key)
 
     @staticmethod
     def check_credentials(connection: SSHConnection) -> tuple[bool, str | None]:
@@ -689,14 +800,13 @@ class SSHLauncher:
                 base_ssh_args.extend(["-o", "BatchMode=yes"])
             else:
                 base_ssh_args.extend(["-o", "BatchMode=no"])
-            env = os.environ.copy()
+            env: dict[str, str] | None = None
             if sys.platform != "win32":
                 key_path = connection.key_path
                 if key_path:
                     converted = SSHLauncher._convert_ppk_key(key_path, prefix="sshive_key_")
                     if converted:
-                        temp_key = converted
-                        key_path = converted
+                        key_path = temp_key = converted
                     elif key_path.lower().endswith(".ppk"):
                         puttygen = SSHLauncher._which("puttygen")
                         if not puttygen:
@@ -720,7 +830,7 @@ class SSHLauncher:
                         return False, "sshpass not found (required for password check)"
                     cmd = [sshpass, "-e"] + cmd
                     cmd.extend(["-o", "PubkeyAuthentication=no"])
-                    env["SSHPASS"] = connection.password
+                    env = {**os.environ, "SSHPASS": connection.password}
 
                 cmd.append(f"{connection.user}@{connection.host}")
                 cmd.append("true")
@@ -770,11 +880,8 @@ class SSHLauncher:
         except Exception as e:
             return False, f"Error during authentication check: {str(e)}"
         finally:
-            if temp_key and os.path.exists(temp_key):
-                try:
-                    os.unlink(temp_key)
-                except Exception:
-                    pass
+            if temp_key:
+                SSHLauncher._remove_file(temp_key)
 
     @staticmethod
     def is_host_key_mismatch_error(error_text: str | None) -> bool:
@@ -1,11 +1,13 @@
 """Dialog for adding and editing SSH connections."""
 
+import functools
+import logging
 from pathlib import Path
 
 import qtawesome as qta
 from nanoid import generate
-from PySide6.QtCore import QStandardPaths, Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QSignalBlocker, QStandardPaths, Qt, QTimer, Signal
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -31,6 +33,14 @@ from sshive.ui.icon_manager import IconManager
 from sshive.ui.theme import ThemeManager
 from sshive.ui.utils import show_connection_test_debug_dialog
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4)
+def _password_toggle_icons(color: str) -> tuple[QIcon, QIcon]:
+    """Return the (show, hide) password toggle icons, rendered once per color."""
+    return qta.icon("fa5s.eye", color=color), qta.icon("fa5s.eye-slash", color=color)
+
 
 class PortForwardDialog(QDialog):
     """Dialog for adding or editing a single port forward rule."""
@@ -297,6 +307,7 @@ class AddConnectionDialog(QDialog):
     """Dialog for adding or editing SSH connections."""
 
     CUSTOM_ICON_ID_LENGTH = 5
+    ICON_PREVIEW_DEBOUNCE_MS = 250
 
     def __init__(
         self,
@@ -372,7 +383,7 @@ class AddConnectionDialog(QDialog):
 
         icon_color = "white" if ThemeManager.is_system_dark_mode() else "black"
 
-        self.toggle_password_btn.setIcon(qta.icon("fa5s.eye", color=icon_color))
+        self.toggle_password_btn.setIcon(_password_toggle_icons(icon_color)[0])
         self.toggle_password_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.toggle_password_btn.clicked.connect(self._toggle_password_visibility)
         self.toggle_password_btn.setStyleSheet("border: none; padding: 4px;")
@@ -405,6 +416,12 @@ class AddConnectionDialog(QDialog):
         self.icon_input.setPlaceholderText(self.tr("e.g. proxmox, home-assistant"))
         self.icon_input.textChanged.connect(self._update_icon_preview_from_text)
 
+        # Refresh the preview only once typing pauses, not for every partial name
+        self._icon_preview_timer = QTimer(self)
+        self._icon_preview_timer.setSingleShot(True)
+        self._icon_preview_timer.setInterval(self.ICON_PREVIEW_DEBOUNCE_MS)
+        self._icon_preview_timer.timeout.connect(self._apply_pending_icon_preview)
+
         self.icon_preview = IconDropLabel()
         self.icon_preview.setFixedSize(32, 32)
         self._drag_is_active = False
@@ -546,6 +563,7 @@ class AddConnectionDialog(QDialog):
 
         if self.connection.icon:
             self.icon_input.setText(self.connection.icon)
+            self._icon_preview_timer.stop()
             self._update_icon_preview(self.connection.icon)
 
         # Set connection type
@@ -692,9 +710,16 @@ class AddConnectionDialog(QDialog):
             lower_text = text
 
         if text != lower_text:
-            self.icon_input.setText(lower_text)
-            return  # setText will re-trigger textChanged
-        self._update_icon_preview(text)
+            # Rewrite in place without re-entering this slot via textChanged
+            cursor = self.icon_input.cursorPosition()
+            with QSignalBlocker(self.icon_input):
+                self.icon_input.setText(lower_text)
+            self.icon_input.setCursorPosition(cursor)
+        self._icon_preview_timer.start()
+
+    def _apply_pending_icon_preview(self):
+        """Update the preview for the icon text once typing has settled."""
+        self._update_icon_preview(self.icon_input.text())
 
     def _update_icon_preview(self, icon_name):
         """Update the icon preview label."""
@@ -729,25 +754,19 @@ class AddConnectionDialog(QDialog):
         manager = IconManager.instance()
 
         # Try to get cached icon
-        icon_path = manager.get_icon_path(icon_name)
-        if icon_path and Path(icon_path).exists():
-            pixmap = QPixmap(str(icon_path))
-            self.icon_preview.setPixmap(
-                pixmap.scaled(
-                    32,
-                    32,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+        pixmap = manager.get_scaled_pixmap(icon_name, 32)
+        if pixmap is not None:
+            self.icon_preview.setPixmap(pixmap)
+        elif not manager.is_known_icon(icon_name):
+            self._show_icon_not_found(icon_name)
         else:
             # Trigger fetch if not cached
-            manager.fetch_icon(icon_name)
             self.icon_preview.setPixmap(
                 qta.icon(
                     "fa5s.spinner", color="gray", animation=qta.Spin(self.icon_preview)
                 ).pixmap(20, 20)
             )
+            manager.fetch_icon(icon_name)
 
     def _on_icon_loaded(self, name, path):
         """Handle icon loaded signal."""
@@ -756,10 +775,14 @@ class AddConnectionDialog(QDialog):
 
     def _on_icon_failed(self, name):
         if self.icon_input.text() == name:
-            self.icon_preview.setPixmap(
-                qta.icon("fa5s.exclamation-circle", color="#e05252").pixmap(20, 20)
-            )
-            self.icon_preview.setToolTip(self.tr("Icon '{}' not found").format(name))
+            self._show_icon_not_found(name)
+
+    def _show_icon_not_found(self, name):
+        """Show the error marker for an icon name that can't be resolved."""
+        self.icon_preview.setPixmap(
+            qta.icon("fa5s.exclamation-circle", color="#e05252").pixmap(20, 20)
+        )
+        self.icon_preview.setToolTip(self.tr("Icon '{}' not found").format(name))
 
     def _auto_fill_icon(self, name):
         """Auto-fill icon field based on connection name."""
@@ -769,23 +792,20 @@ class AddConnectionDialog(QDialog):
         if not self.icon_input.text():
             # Convert name to kebab-case-ish (simplified)
             icon_name = name.lower().replace(" ", "-")
-            self.icon_input.setText(icon_name)
-            self._update_icon_preview(icon_name)
+            self.icon_input.setText(icon_name)  # preview follows via the debounce timer
 
     def _toggle_password_visibility(self):
         """Toggle the echo mode of the password input."""
         current_mode = self.password_input.echoMode()
-        from sshive.ui.theme import ThemeManager
-
         icon_color = "white" if ThemeManager.is_system_dark_mode() else "black"
-        import qtawesome as qta
+        show_icon, hide_icon = _password_toggle_icons(icon_color)
 
         if current_mode == QLineEdit.EchoMode.Password:
             self.password_input.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_password_btn.setIcon(qta.icon("fa5s.eye-slash", color=icon_color))
+            self.toggle_password_btn.setIcon(hide_icon)
         else:
             self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_password_btn.setIcon(qta.icon("fa5s.eye", color=icon_color))
+            self.toggle_password_btn.setIcon(show_icon)
 
     def _build_connection_for_test(self) -> SSHConnection | None:
         """Build a temporary connection object from current form values."""
@@ -1007,5 +1027,5 @@ class AddConnectionDialog(QDialog):
                     port_forwards=port_forwards,
                 )
         except ValueError as e:
-            print(f"Validation error: {e}")
+            logger.warning("Validation error: %s", e)
             return None
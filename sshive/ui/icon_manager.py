@@ -1,12 +1,176 @@
 """Icon manager for retrieving and caching selfh.st icons."""
 
+import hashlib
 import json
+import logging
+import mmap
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QStandardPaths, QUrl, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    QByteArray,
+    QObject,
+    QRunnable,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# selfh.st icon names; anything else (paths, spaces, uppercase) never touches disk or network
+_is_icon_name = re.compile(r"[a-z0-9][a-z0-9._-]{0,127}").fullmatch
+
+# The manifest is a flat list of a few thousand names; orjson decodes it several times faster.
+# orjson also parses memoryviews in place, the stdlib needs a bytes copy.
+if orjson is not None:
+    _json_loads = orjson.loads
+else:
+
+    def _json_loads(data):
+        return json.loads(bytes(data))
+
+
+def _atomic_write(path: Path, data: bytes | QByteArray):
+    """Write data to path so readers only ever see the old or the complete new file.
+
+    No fsync: everything written here is a cache that can be downloaded again.
+    The buffer goes straight to the fd, without a Python file object around it.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _content_digest(data: bytes | QByteArray | memoryview) -> bytes:
+    """Return a short content hash used to detect unchanged manifests."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _manifest_names(data: list | dict) -> frozenset[str]:
+    """Extract icon names from decoded manifest data.
+
+    Names are interned so they share storage with the identical strings
+    used elsewhere, and set probes can match on identity first.
+    """
+    # Structure: ["proxmox", "home-assistant", ...]
+    if isinstance(data, list):
+        return frozenset(sys.intern(item) for item in data if isinstance(item, str))
+    return frozenset()
+
+
+def _load_parsed_manifest(cache_dir: Path, digest: bytes) -> frozenset[str] | None:
+    """Return the stored icon set if it was built from the manifest with this digest.
+
+    icons.txt holds the manifest digest in hex on its first line and one icon
+    name per line after it; the names are only decoded once the digest matches.
+    """
+    try:
+        data = (cache_dir / "icons.txt").read_bytes()
+    except OSError:
+        return None
+    header, _, body = data.partition(b"\n")
+    if header != digest.hex().encode("ascii"):
+        return None
+    try:
+        names = body.decode("utf-8").split("\n") if body else []
+    except UnicodeDecodeError:
+        return None
+    # Intern like _manifest_names does
+    return frozenset(map(sys.intern, names))
+
+
+def _store_parsed_manifest(cache_dir: Path, digest: bytes, icons: frozenset[str]):
+    """Store the icon set with its manifest digest so warm starts skip the JSON parse."""
+    # A name containing a newline cannot round-trip; such manifests are just re-parsed
+    if any("\n" in name for name in icons):
+        return
+    try:
+        _atomic_write(
+            cache_dir / "icons.txt",
+            "\n".join([digest.hex(), *icons]).encode("utf-8"),
+        )
+    except OSError as e:
+        logger.debug("Could not store parsed manifest: %s", e)
+
+
+def _read_cached_manifest(cache_dir: Path) -> tuple[frozenset[str], bytes, bytes | None] | None:
+    """Read the cached manifest as (icons, digest, etag), or None if there is no usable copy."""
+    manifest_path = cache_dir / "icons.json"
+    if not manifest_path.exists():
+        return None
+
+    try:
+        # Map the file rather than reading it into a bytes object first
+        with (
+            open(manifest_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                digest = _content_digest(view)
+                icons = _load_parsed_manifest(cache_dir, digest)
+                if icons is None:
+                    icons = _manifest_names(_json_loads(view))
+                    _store_parsed_manifest(cache_dir, digest, icons)
+    except Exception as e:
+        logger.warning("Failed to load cached manifest: %s", e)
+        return None
+
+    # Only revalidate when we actually hold the cached copy
+    try:
+        etag = (cache_dir / "icons.json.etag").read_bytes().strip() or None
+    except OSError:
+        etag = None
+    return icons, digest, etag
+
+
+class _ManifestCacheSignals(QObject):
+    """Signals for _ManifestCacheLoader (QRunnable is not a QObject)."""
+
+    loaded = Signal(object)  # result of _read_cached_manifest()
+
+
+class _ManifestCacheLoader(QRunnable):
+    """Read and parse the cached manifest on a pool thread."""
+
+    def __init__(self, cache_dir: Path):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.signals = _ManifestCacheSignals()
+
+    def run(self):
+        self.signals.loaded.emit(_read_cached_manifest(self.cache_dir))
+
 
 class IconManager(QObject):
     """Manages fetching and caching of icons."""
@@ -16,6 +180,16 @@ class IconManager(QObject):
     icon_failed = Signal(str)  # name
 
     BASE_URL = "https://cdn.jsdelivr.net/gh/selfhst/icons/webp"
+    PIXMAP_CACHE_SIZE = 128
+    ICON_CACHE_SIZE = 256
+    # Above this many downloaded icons, the least recently used quarter is deleted
+    MAX_CACHED_ICONS = 4096
+    MAX_CONCURRENT_DOWNLOADS = 6
+    TRANSFER_TIMEOUT_MS = 5000
+    # Keep idle CDN connections around so later icon fetches skip the TLS handshake
+    CONNECTION_IDLE_SECONDS = 120
+    # Rescan the cache dir this often to notice icons added or removed by other instances
+    CACHE_RESCAN_SECONDS = 3600
     MANIFEST_URL = "https://raw.githubusercontent.com/selfhst/icons/main/index.json"
 
     @staticmethod
@@ -27,14 +201,37 @@ class IconManager(QObject):
         """Initialize icon manager."""
         super().__init__()
         self.network = QNetworkAccessManager(self)
+        self.network.setTransferTimeout(self.TRANSFER_TIMEOUT_MS)
         self.pending_replies: set[QNetworkReply] = set()
         self.cache_dir = (
             Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation))
             / "icons"
         )
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        self.valid_icons: set[str] = set()
+        self.valid_icons: frozenset[str] = frozenset()
+        # Digest of the manifest bytes currently parsed into valid_icons
+        self._manifest_digest: bytes | None = None
+        self._manifest_loader: _ManifestCacheLoader | None = None
+        # Cache dir and manifest are set up on first use, see _ensure_ready()
+        self._ready = False
+        # Icon downloads in flight, and those waiting for a free slot
+        self._inflight: set[str] = set()
+        self._queued: deque[str] = deque()
+        # (name, size) -> decoded and scaled pixmap, least recently used first
+        self._pixmap_cache: OrderedDict[tuple[str, int], QPixmap] = OrderedDict()
+        # name -> QIcon shared by every widget showing it, least recently used first
+        self._icon_cache: OrderedDict[str, QIcon] = OrderedDict()
+        # Names of the icons on disk, from one directory scan, see _cached_icon_names()
+        self._cached_files: set[str] = set()
+        self._cached_files_scanned_at: float | None = None
+        self._cache_dir_str = ""
+
+    def _ensure_ready(self):
+        """Create the cache dir and load the manifest the first time icons are needed."""
+        if self._ready:
+            return
+        self._ready = True
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._load_manifest()
 
     def cleanup(self):
@@ -48,37 +245,98 @@ class IconManager(QObject):
                 reply.abort()
             reply.deleteLater()
         self.pending_replies.clear()
-        self.valid_icons.clear()
+        self._inflight.clear()
+        self._queued.clear()
+        self.valid_icons = frozenset()
+        self._pixmap_cache.clear()
+        self._icon_cache.clear()
+        self._cached_files.clear()
+        self._cached_files_scanned_at = None
 
     def __del__(self):
         """Ensure cleanup on destruction."""
         pass
 
     def _track_reply(self, reply: QNetworkReply):
-        """Track a reply to ensure it can be aborted if needed."""
-        self.pending_replies.add(reply)
-        reply.finished.connect(self._on_reply_finished)
+        """Track a reply to ensure it can be aborted if needed.
 
-    def _on_reply_finished(self):
-        """Remove finished reply from tracking."""
-        reply = self.sender()
-        if reply in self.pending_replies:
-            self.pending_replies.discard(reply)
-
-    def _load_manifest(self):
-        """Load icon manifest from cache or network."""
-        manifest_path = self.cache_dir / "icons.json"
+        The reply's own finished handler drops it again, so no extra slot is connected.
+        """
+        self.pending_replies.add(reply)
 
-        if manifest_path.exists():
+    def _cached_icon_names(self) -> set[str]:
+        """Return the names of downloaded icons, rescanning the cache dir when stale."""
+        now = time.monotonic()
+        scanned_at = self._cached_files_scanned_at
+        if scanned_at is None or now - scanned_at >= self.CACHE_RESCAN_SECONDS:
+            self._cache_dir_str = str(self.cache_dir)
             try:
-                with open(manifest_path) as f:
-                    data = json.load(f)
-                    self._parse_manifest(data)
-            except Exception as e:
-                print(f"Failed to load cached manifest: {e}")
+                with os.scandir(self._cache_dir_str) as entries:
+                    icon_entries = [entry for entry in entries if entry.name.endswith(".webp")]
+            except OSError:
+                icon_entries = []
+            if len(icon_entries) > self.MAX_CACHED_ICONS:
+                icon_entries = self._prune_icon_files(icon_entries)
+            self._cached_files = {entry.name[:-5] for entry in icon_entries}
+            self._cached_files_scanned_at = now
+        return self._cached_files
+
+    def _prune_icon_files(self, entries: list[os.DirEntry]) -> list[os.DirEntry]:
+        """Delete the least recently used quarter of the icon files; return the kept ones."""
+
+        def last_used(entry: os.DirEntry) -> float:
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        entries = sorted(entries, key=last_used)
+        cutoff = len(entries) // 4
+        for entry in entries[:cutoff]:
+            name = entry.name[:-5]
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            self._forget_icon(name)
+        return entries[cutoff:]
+
+    def _forget_icon(self, name: str):
+        """Drop decoded copies of an icon whose file changed or was removed."""
+        self._icon_cache.pop(name, None)
+        for key in [key for key in self._pixmap_cache if key[0] == name]:
+            del self._pixmap_cache[key]
+
+    def _make_request(self, url: str) -> QNetworkRequest:
+        """Build a GET request that may share a pooled HTTP/2 connection."""
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        request.setAttribute(
+            QNetworkRequest.Attribute.ConnectionCacheExpiryTimeoutSecondsAttribute,
+            self.CONNECTION_IDLE_SECONDS,
+        )
+        return request
 
-        # Fetch update
-        request = QNetworkRequest(QUrl(self.MANIFEST_URL))
+    _digest = staticmethod(_content_digest)
+
+    def _load_manifest(self):
+        """Load the cached manifest off the UI thread, then revalidate it over the network."""
+        loader = _ManifestCacheLoader(self.cache_dir)
+        loader.signals.loaded.connect(self._on_cached_manifest_loaded)
+        # Keep the loader (and its signals object) alive until it reports back
+        self._manifest_loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_cached_manifest_loaded(self, cached: tuple | None):
+        """Apply the cached manifest and fetch an update, revalidating by ETag."""
+        self._manifest_loader = None
+        etag = None
+        if cached is not None and self._manifest_digest is None:
+            self.valid_icons, self._manifest_digest, etag = cached
+
+        request = self._make_request(self.MANIFEST_URL)
+        if etag:
+            request.setRawHeader(b"If-None-Match", etag)
         reply = self.network.get(request)
         self._track_reply(reply)
         reply.finished.connect(self._on_manifest_downloaded_finished)
@@ -86,40 +344,63 @@ class IconManager(QObject):
     def _on_manifest_downloaded_finished(self):
         """Internal slot for manifest download completion."""
         reply = self.sender()
+        self.pending_replies.discard(reply)
         self._on_manifest_downloaded(reply)
 
     def _on_manifest_downloaded(self, reply: QNetworkReply):
         """Handle manifest download."""
         if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll().data()
-            try:
-                json_data = json.loads(data)
-                self._parse_manifest(json_data)
+            # 304 Not Modified: the cached manifest is still current
+            if reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 304:
+                reply.deleteLater()
+                return
 
-                # Cache it
-                with open(self.cache_dir / "icons.json", "wb") as f:
-                    f.write(data)
+            # Hash and write straight from Qt's buffer; copy to bytes only to parse
+            data = reply.readAll()
+            try:
+                digest = self._digest(data)
+                if digest != self._manifest_digest:
+                    json_data = _json_loads(data.data())
+                    self._parse_manifest(json_data)
+                    self._manifest_digest = digest
+
+                    # Cache it
+                    _atomic_write(self.cache_dir / "icons.json", data)
+                    _store_parsed_manifest(self.cache_dir, digest, self.valid_icons)
+
+                etag = reply.rawHeader("ETag").data()
+                if etag:
+                    _atomic_write(self.cache_dir / "icons.json.etag", etag)
             except Exception as e:
-                print(f"Failed to parse manifest: {e}")
+                logger.warning("Failed to parse manifest: %s", e)
         reply.deleteLater()
 
     def _parse_manifest(self, data: list | dict):
         """Parse manifest data to populate valid icons set."""
-        self.valid_icons.clear()
-        if isinstance(data, list):
-            for item in data:
-                # Structure: ["proxmox", "home-assistant", ...]
-                if isinstance(item, str):
-                    self.valid_icons.add(item)
+        self.valid_icons = _manifest_names(data)
 
     def get_icon(self, name: str) -> QIcon | None:
         """Get icon if cached, otherwise trigger fetch."""
         if not name:
             return None
 
-        icon_path = self.cache_dir / f"{name}.webp"
-        if icon_path.exists():
-            return QIcon(str(icon_path))
+        icon = self._icon_cache.get(name)
+        if icon is not None:
+            self._icon_cache.move_to_end(name)
+            return icon
+
+        icon_path = self.get_icon_path(name)
+        if icon_path:
+            icon = QIcon(icon_path)
+            self._icon_cache[name] = icon
+            if len(self._icon_cache) > self.ICON_CACHE_SIZE:
+                self._icon_cache.popitem(last=False)
+            # Mark as recently used for _prune_icon_files (once per decode, not per call)
+            try:
+                os.utime(icon_path)
+            except OSError:
+                pass
+            return icon
 
         # Trigger fetch
         self.fetch_icon(name)
@@ -127,55 +408,125 @@ class IconManager(QObject):
 
     def get_icon_path(self, name: str) -> str | None:
         """Get local path to icon if it exists."""
-        if not name:
+        if not name or not _is_icon_name(name):
             return None
 
-        icon_path = self.cache_dir / f"{name}.webp"
-        if icon_path.exists():
-            return str(icon_path)
+        self._ensure_ready()
+
+        if name in self._cached_icon_names():
+            return os.path.join(self._cache_dir_str, f"{name}.webp")
         return None
 
+    def get_scaled_pixmap(self, name: str, size: int = 32) -> QPixmap | None:
+        """Get a cached icon scaled to fit size x size, or None if not downloaded yet."""
+        key = (name, size)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+            return pixmap
+
+        icon_path = self.get_icon_path(name)
+        if not icon_path:
+            return None
+
+        pixmap = QPixmap(icon_path).scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        if not pixmap.isNull():
+            self._pixmap_cache[key] = pixmap
+            if len(self._pixmap_cache) > self.PIXMAP_CACHE_SIZE:
+                self._pixmap_cache.popitem(last=False)
+        return pixmap
+
+    def is_known_icon(self, name: str) -> bool:
+        """Return False for malformed names, or when the loaded manifest does not list name."""
+        if not _is_icon_name(name):
+            return False
+        self._ensure_ready()
+        return not self.valid_icons or name in self.valid_icons
+
     def fetch_icon(self, name: str):
         """Fetch icon from network."""
         if not name:
             return
 
-        icon_path = self.cache_dir / f"{name}.webp"
-        if icon_path.exists():
-            self.icon_loaded.emit(name, str(icon_path))
+        cached_path = self.get_icon_path(name)
+        if cached_path:
+            self.icon_loaded.emit(name, cached_path)
+            return
+
+        # Malformed names and names missing from the manifest would only 404 on the CDN
+        if not self.is_known_icon(name):
+            self.icon_failed.emit(name)
+            return
+
+        # Already requested: its icon_loaded/icon_failed reaches every listener
+        if name in self._inflight or name in self._queued:
+            return
+
+        # Cap parallel downloads; the rest wait and share the HTTP/2 connection
+        if len(self._inflight) >= self.MAX_CONCURRENT_DOWNLOADS:
+            self._queued.append(name)
             return
 
+        icon_path = self.cache_dir / f"{name}.webp"
         url = f"{self.BASE_URL}/{name}.webp"
-        request = QNetworkRequest(QUrl(url))
+        request = self._make_request(url)
         reply = self.network.get(request)
         self._track_reply(reply)
+        self._inflight.add(name)
         # Use dynamic property to pass data to callback safely
         reply.setProperty("icon_name", name)
         reply.setProperty("icon_path", str(icon_path))
         reply.finished.connect(self._on_icon_downloaded_finished)
 
+    def fetch_icons(self, names: Iterable[str]):
+        """Prefetch several icons, skipping ones already cached or requested.
+
+        Values that are not manifest icon names (such as custom icon file paths)
+        are ignored. Downloads beyond MAX_CONCURRENT_DOWNLOADS wait in the queue
+        and start as earlier ones finish.
+        """
+        for name in dict.fromkeys(names):
+            if name and self.is_known_icon(name) and not self.get_icon_path(name):
+                self.fetch_icon(name)
+
     def _on_icon_downloaded_finished(self):
         """Internal slot for icon download completion."""
         reply = self.sender()
+        self.pending_replies.discard(reply)
+        self._finish_icon_reply(reply)
+
+    def _finish_icon_reply(self, reply: QNetworkReply):
+        """Handle a completed icon reply and start the next queued download."""
         name = reply.property("icon_name")
+        self._inflight.discard(name)
 
         if (
             reply.error() != QNetworkReply.NetworkError.NoError
             or reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) != 200
         ):
+            reply.deleteLater()
             self.icon_failed.emit(name)
-            return
+        else:
+            path = Path(reply.property("icon_path"))
+            self._on_icon_downloaded(reply, name, path)
 
-        path = Path(reply.property("icon_path"))
-        self._on_icon_downloaded(reply, name, path)
+        # Loop: a queued icon that is cached or unknown by now finishes without a download
+        while self._queued and len(self._inflight) < self.MAX_CONCURRENT_DOWNLOADS:
+            self.fetch_icon(self._queued.popleft())
 
     def _on_icon_downloaded(self, reply: QNetworkReply, name: str, path: Path):
         """Handle icon download."""
         if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll().data()
-            if data:
-                with open(path, "wb") as f:
-                    f.write(data)
+            data = reply.readAll()
+            if not data.isEmpty():
+                _atomic_write(path, data)
+                self._cached_files.add(name)
+                self._forget_icon(name)
                 self.icon_loaded.emit(name, str(path))
         else:
             pass
@@ -1,7 +1,11 @@
 """Main application window."""
 
+import bisect
+import functools
 import hashlib
+import itertools
 import json
+import logging
 import os
 import random
 import subprocess
@@ -9,7 +13,18 @@ import uuid
 from pathlib import Path
 
 import qtawesome as qta
-from PySide6.QtCore import QEvent, QObject, QSettings, QStandardPaths, Qt
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSettings,
+    QSignalBlocker,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QAction, QIcon, QKeyEvent
 from PySide6.QtWidgets import (
     QApplication,
@@ -30,7 +45,6 @@ from PySide6.QtWidgets import (
     QToolButton,
     QTreeWidget,
     QTreeWidgetItem,
-    QTreeWidgetItemIterator,
     QVBoxLayout,
     QWidget,
 )
@@ -48,10 +62,102 @@ from sshive.ui.update_dialog import UpdateDialog
 from sshive.ui.utils import show_connection_test_debug_dialog
 from sshive.updater import UpdateChecker
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize a payload as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=64)
+def _icon(name: str, color: str) -> QIcon:
+    """Return a qtawesome icon, rendering each (name, color) glyph only once."""
+    return qta.icon(name, color=color)
+
+
+# fa5s icons drawn in the theme colour, rendered once per theme into MainWindow._icons
+_THEMED_ICONS = (
+    "bars",
+    "clone",
+    "edit",
+    "flask",
+    "folder",
+    "plus",
+    "rocket",
+    "search",
+    "server",
+    "trash",
+)
+
+
+class _CredentialCheckSignals(QObject):
+    """Signals for _CredentialCheckTask (QRunnable is not a QObject)."""
+
+    finished = Signal(object, bool, object)  # connection, success, error message
+
+
+class _CredentialCheckTask(QRunnable):
+    """Run SSHLauncher.check_credentials on a pool thread."""
+
+    def __init__(self, connection: SSHConnection):
+        super().__init__()
+        self.connection = connection
+        self.signals = _CredentialCheckSignals()
+
+    def run(self):
+        success, error = SSHLauncher.check_credentials(self.connection)
+        self.signals.finished.emit(self.connection, success, error)
+
+
+class _LoadConnectionsSignals(QObject):
+    """Signals for _LoadConnectionsTask (QRunnable is not a QObject)."""
+
+    # load generation, ConnectionStorage.read_connections() result or None if it failed
+    loaded = Signal(int, object)
+
+
+class _LoadConnectionsTask(QRunnable):
+    """Read and parse the connections file on a pool thread.
+
+    The storage cache is left alone here; MainWindow adopts the result on the UI thread.
+    """
+
+    def __init__(self, storage: ConnectionStorage, generation: int):
+        super().__init__()
+        self.storage = storage
+        self.generation = generation
+        self.signals = _LoadConnectionsSignals()
+
+    def run(self):
+        try:
+            result = self.storage.read_connections()
+        except Exception as e:
+            logger.debug("Background connection load failed: %s", e)
+            result = None
+        self.signals.loaded.emit(self.generation, result)
+
 
 class MainWindow(QMainWindow):
     """Main application window with connection tree."""
 
+    ICON_LOAD_BATCH_MS = 50
+    SEARCH_DEBOUNCE_MS = 120
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -59,24 +165,58 @@ class MainWindow(QMainWindow):
         # Load settings first to get backup configuration
         self.settings = QSettings("sshive", "sshive")
         max_backups = int(self.settings.value("max_backups", "10"))
+        # Read on every connect; kept in memory and refreshed by the settings dialog
+        self._verify_credentials = self.settings.value("verify_credentials", "true") == "true"
 
         self.storage = ConnectionStorage(max_backups=max_backups)
         self.connections: list[SSHConnection] = []
+        # Group name -> its connections; reset whenever self.connections changes
+        self._grouped_cache: dict[str, list[SSHConnection]] | None = None
+        # Bumped by every load so a slower background load cannot overwrite a newer one
+        self._load_generation = 0
+        self._load_task: _LoadConnectionsTask | None = None
         self._is_quitting = False
         self.tray_icon: QSystemTrayIcon | None = None
         self.tray_toggle_action: QAction | None = None
+        # Connection id -> (running _CredentialCheckTask, whether it is a retry)
+        self._credential_checks: dict[str, tuple[_CredentialCheckTask, bool]] = {}
 
         # Determine icon color based on theme preference
         self._apply_theme()
 
         self.incognito_mode = False
+        self._incognito_tooltip = self.tr("Incognito mode active")
+        # Fake connections live next to the app config; loaded on the first toggle only
+        self._incognito_path = (
+            Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation))
+            / "incognito-connections.json"
+        )
+        self._incognito_connections: list[SSHConnection] | None = None
+        # Search state, rebuilt by _populate_tree
+        self._group_items: dict[str, QTreeWidgetItem] = {}
+        self._items_by_icon_name: dict[str, list[QTreeWidgetItem]] = {}
+        # Connection id -> its rows; imports can leave several connections sharing an id
+        self._conn_id_to_item: dict[str, list[QTreeWidgetItem]] = {}
+        self._search_index: list[tuple[str, str, QTreeWidgetItem, str]] = []
+        self._search_text = ""
+        self._search_matches: list[tuple[str, str, QTreeWidgetItem, str]] = []
+        self._search_haystack = ""
+        self._search_offsets: list[int] = []
         self._setup_ui()
         self._setup_shortcuts()
 
+        # Downloads tend to finish in bursts; apply them to the tree in one pass
+        self._pending_icon_loads: dict[str, str] = {}
+        self._icon_load_timer = QTimer(self)
+        self._icon_load_timer.setSingleShot(True)
+        self._icon_load_timer.setInterval(self.ICON_LOAD_BATCH_MS)
+        self._icon_load_timer.timeout.connect(self._apply_pending_icon_loads)
+
         self.icon_manager = IconManager.instance()
         self.icon_manager.icon_loaded.connect(self._on_icon_loaded)
+        ThemeManager.color_scheme_watcher().changed.connect(self._on_system_color_scheme_changed)
 
-        self._load_connections()
+        self._load_connections_async()
 
         self.setWindowTitle(self.tr("SSHive - SSH Connection Manager"))
         self._setup_system_tray()
@@ -88,6 +228,7 @@ class MainWindow(QMainWindow):
         self.restoreState(self.settings.value("windowState", b""))
 
         header_state = self.settings.value("columnState")
+        self._column_state = header_state
         if header_state:
             self.tree.header().restoreState(header_state)
 
@@ -112,7 +253,7 @@ class MainWindow(QMainWindow):
 
         tray_icon = self.windowIcon()
         if tray_icon.isNull():
-            tray_icon = qta.icon("fa5s.server", color=self.icon_color)
+            tray_icon = self._icons["server"]
 
         self.tray_icon = QSystemTrayIcon(tray_icon, self)
         self.tray_icon.setToolTip(self.tr("SSHive"))
@@ -207,6 +348,10 @@ class MainWindow(QMainWindow):
         Args:
             args: List of command flags (e.g., ['--show', '--quick-connect']).
         """
+        # On a cold start commands arrive before the background load reports back
+        if self._load_task is not None and self._load_task.generation == self._load_generation:
+            self._load_connections()
+
         for arg in args:
             if arg == "--show":
                 self._show_window()
@@ -274,7 +419,7 @@ class MainWindow(QMainWindow):
         button_layout.setContentsMargins(0, 0, 0, 0)
 
         show_main_btn = QPushButton(
-            qta.icon("fa5s.window-restore", color=self.icon_color),
+            _icon("fa5s.window-restore", self.icon_color),
             self.tr("Show Main Window"),
             self,
         )
@@ -522,7 +667,7 @@ class MainWindow(QMainWindow):
             return None
 
         candidate = Path(icon_value).expanduser()
-        if candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             return candidate
         return None
 
@@ -577,11 +722,19 @@ class MainWindow(QMainWindow):
         self.search_bar.setPlaceholderText(self.tr("Search connections..."))
         self.search_bar.setClearButtonEnabled(True)
         self.search_bar.setFixedWidth(300)
-        search_icon = qta.icon("fa5s.search", color=self.icon_color)
+        search_icon = self._icons["search"]
         self.search_bar.addAction(search_icon, QLineEdit.ActionPosition.LeadingPosition)
         self.search_bar.textChanged.connect(self._on_search_text_changed)
         top_layout.addWidget(self.search_bar)
 
+        # Filter once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(
+            lambda: self._apply_search_filter(self.search_bar.text())
+        )
+
         top_layout.addStretch()
 
         # Update button (hidden by default)
@@ -590,8 +743,8 @@ class MainWindow(QMainWindow):
         self.update_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.update_btn.setToolTip(self.tr("A new version is available! Click to update."))
 
-        self.update_icon_default = qta.icon("fa5s.arrow-alt-circle-up", color="#3498db")
-        self.update_icon_hover = qta.icon("fa5s.arrow-alt-circle-up", color="white")
+        self.update_icon_default = _icon("fa5s.arrow-alt-circle-up", "#3498db")
+        self.update_icon_hover = _icon("fa5s.arrow-alt-circle-up", "white")
         self.update_btn.setIcon(self.update_icon_default)
 
         self.update_btn.setStyleSheet("""
@@ -613,7 +766,7 @@ class MainWindow(QMainWindow):
         top_layout.addWidget(self.update_btn)
 
         # Settings button (bars/burger) - Now a menu
-        settings_icon = qta.icon("fa5s.bars", color=self.icon_color)
+        settings_icon = self._icons["bars"]
         self.settings_btn = QToolButton()
         self.settings_btn.setIcon(settings_icon)
         self.settings_btn.setToolTip(self.tr("Options"))
@@ -624,7 +777,7 @@ class MainWindow(QMainWindow):
         self.settings_menu = QMenu(self)
 
         # Check for Updates action
-        check_updates_icon = qta.icon("fa5s.arrow-alt-circle-up", color=self.icon_color)
+        check_updates_icon = _icon("fa5s.arrow-alt-circle-up", self.icon_color)
         self.check_updates_action = QAction(check_updates_icon, self.tr("Check for Updates"), self)
         self.check_updates_action.setToolTip(self.tr("Check for new SSHive updates."))
         self.check_updates_action.triggered.connect(
@@ -643,19 +796,19 @@ class MainWindow(QMainWindow):
         # Export/Import submenu
         backup_menu = self.settings_menu.addMenu(self.tr("Backup and Restore"))
 
-        export_icon = qta.icon("fa5s.file-export", color=self.icon_color)
+        export_icon = _icon("fa5s.file-export", self.icon_color)
         export_action = QAction(export_icon, self.tr("Export Connections"), self)
         export_action.setToolTip(self.tr("Save connections to a file."))
         export_action.triggered.connect(self._export_connections)
         backup_menu.addAction(export_action)
 
-        import_icon = qta.icon("fa5s.file-import", color=self.icon_color)
+        import_icon = _icon("fa5s.file-import", self.icon_color)
         import_action = QAction(import_icon, self.tr("Import Connections"), self)
         import_action.setToolTip(self.tr("Load connections from a file."))
         import_action.triggered.connect(self._import_connections)
         backup_menu.addAction(import_action)
 
-        putty_icon = qta.icon("fa5s.download", color=self.icon_color)
+        putty_icon = _icon("fa5s.download", self.icon_color)
         putty_action = QAction(putty_icon, self.tr("Import from PuTTY/KiTTY"), self)
         putty_action.setToolTip(self.tr("Import sessions from PuTTY or KiTTY configuration files."))
         putty_action.triggered.connect(self._import_putty_sessions)
@@ -663,7 +816,7 @@ class MainWindow(QMainWindow):
 
         backup_menu.addSeparator()
 
-        open_folder_icon = qta.icon("fa5s.folder-open", color=self.icon_color)
+        open_folder_icon = _icon("fa5s.folder-open", self.icon_color)
         open_folder_action = QAction(open_folder_icon, self.tr("Open Config Folder"), self)
         open_folder_action.setToolTip(self.tr("Open config folder in file manager."))
         open_folder_action.triggered.connect(self._open_config_folder)
@@ -672,14 +825,14 @@ class MainWindow(QMainWindow):
         self.settings_menu.addSeparator()
 
         # Settings action
-        settings_icon = qta.icon("fa5s.cog", color=self.icon_color)
+        settings_icon = _icon("fa5s.cog", self.icon_color)
         settings_action = QAction(settings_icon, self.tr("Settings"), self)
         settings_action.setToolTip(self.tr("Configure SSHive settings."))
         settings_action.triggered.connect(self._show_settings_dialog)
         self.settings_menu.addAction(settings_action)
 
         # About action
-        about_icon = qta.icon("fa5s.info-circle", color=self.icon_color)
+        about_icon = _icon("fa5s.info-circle", self.icon_color)
         about_action = QAction(about_icon, self.tr("About"), self)
         about_action.setToolTip(self.tr("About SSHive."))
         about_action.triggered.connect(self._show_about_dialog)
@@ -688,7 +841,7 @@ class MainWindow(QMainWindow):
         self.settings_menu.addSeparator()
 
         # Quit action
-        quit_icon = qta.icon("fa5s.times", color=self.icon_color)
+        quit_icon = _icon("fa5s.times", self.icon_color)
         quit_action = QAction(quit_icon, self.tr("Quit"), self)
         quit_action.setToolTip(self.tr("Exit SSHive."))
         quit_action.triggered.connect(QApplication.quit)
@@ -700,7 +853,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(top_layout)
 
         # Icons for later use
-        add_icon = qta.icon("fa5s.plus", color=self.icon_color)
+        add_icon = self._icons["plus"]
 
         # Connection tree
         self.tree = QTreeWidget()
@@ -715,6 +868,8 @@ class MainWindow(QMainWindow):
         self.tree.setSelectionBehavior(QTreeWidget.SelectionBehavior.SelectRows)
         self.tree.setRootIsDecorated(True)
         self.tree.setIndentation(20)
+        # Every row is one line of text plus a small icon; lets Qt skip per-row size hints
+        self.tree.setUniformRowHeights(True)
         self.tree.setMouseTracking(True)
         self.tree.itemEntered.connect(self._on_item_entered)
         self.tree.itemClicked.connect(self._on_item_clicked)
@@ -738,7 +893,7 @@ class MainWindow(QMainWindow):
         self.add_btn.clicked.connect(self._add_connection)
         button_layout.addWidget(self.add_btn)
 
-        clone_icon = qta.icon("fa5s.clone", color=self.icon_color)
+        clone_icon = self._icons["clone"]
         self.clone_btn = QPushButton(self.tr("Clone"))
         self.clone_btn.setIcon(clone_icon)
         self.clone_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -746,7 +901,7 @@ class MainWindow(QMainWindow):
         self.clone_btn.setEnabled(False)
         button_layout.addWidget(self.clone_btn)
 
-        edit_icon = qta.icon("fa5s.edit", color=self.icon_color)
+        edit_icon = self._icons["edit"]
         self.edit_btn = QPushButton(self.tr("Edit"))
         self.edit_btn.setIcon(edit_icon)
         self.edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -754,7 +909,7 @@ class MainWindow(QMainWindow):
         self.edit_btn.setEnabled(False)
         button_layout.addWidget(self.edit_btn)
 
-        delete_icon = qta.icon("fa5s.trash", color=self.icon_color)
+        delete_icon = self._icons["trash"]
         self.delete_btn = QPushButton(self.tr("Delete"))
         self.delete_btn.setIcon(delete_icon)
         self.delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -764,7 +919,7 @@ class MainWindow(QMainWindow):
 
         button_layout.addStretch()
 
-        test_icon = qta.icon("fa5s.flask", color=self.icon_color)
+        test_icon = self._icons["flask"]
         self.test_btn = QPushButton(self.tr("Test"))
         self.test_btn.setIcon(test_icon)
         self.test_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -772,7 +927,7 @@ class MainWindow(QMainWindow):
         self.test_btn.setEnabled(False)
         button_layout.addWidget(self.test_btn)
 
-        connect_icon = qta.icon("fa5s.rocket", color=self.icon_color)
+        connect_icon = self._icons["rocket"]
         self.connect_btn = QPushButton(self.tr("Connect"))
         self.connect_btn.setIcon(connect_icon)
         self.connect_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -794,7 +949,7 @@ class MainWindow(QMainWindow):
 
     def _show_status(self, message: str):
         """Show a temporary status message."""
-        print(f"Status: {message}")
+        logger.info("Status: %s", message)
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts."""
@@ -811,18 +966,21 @@ class MainWindow(QMainWindow):
             # Backup real connections
             self._real_connections = self.connections.copy()
 
-            # Load or generate fake connections
-            self.connections = self._load_or_generate_incognito_connections()
+            # Load or generate fake connections once, then reuse them for the session
+            if self._incognito_connections is None:
+                self._incognito_connections = self._load_or_generate_incognito_connections()
+            self.connections = list(self._incognito_connections)
         else:
             # Restore real connections
             if hasattr(self, "_real_connections"):
                 self.connections = self._real_connections
 
+        self._grouped_cache = None
         self._populate_tree()
 
-    INCOGNITO_VERSION = 4
+    INCOGNITO_VERSION = 5
 
-    INCOGNITO_SERVICES = [
+    INCOGNITO_SERVICES = (
         ("Plex", "Media", "plex"),
         ("Nextcloud", "Storage", "nextcloud"),
         ("Home Assistant", "Automation", "home-assistant"),
@@ -870,26 +1028,27 @@ class MainWindow(QMainWindow):
         ("Heimdall", "Web", "heimdall"),
         ("Flame", "Web", "flame"),
         ("Organizr", "Web", "organizr"),
-    ]
+    )
+
+    # (first two octets, number of subnets) for the private ranges fake hosts live in
+    INCOGNITO_NETWORKS = (("192.168", 10), ("10.0", 50), ("172.16", 32))
+
+    INCOGNITO_USERS = ("admin", "root", "pi", "user", "manager", "maintainer", "sysop", "dev")
 
     def _load_or_generate_incognito_connections(self) -> list[SSHConnection]:
         """Load fake connections from file or generate them deterministically."""
 
         # Try to load from incognito-connections.json in the same dir as the app config
-        config_dir = Path(
-            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation)
-        )
-        incognito_path = config_dir / "incognito-connections.json"
-
-        if incognito_path.exists():
-            try:
-                with open(incognito_path) as f:
-                    data = json.load(f)
+        incognito_path = self._incognito_path
 
-                    if isinstance(data, dict) and data.get("version") == self.INCOGNITO_VERSION:
-                        return [SSHConnection.from_dict(conn) for conn in data["connections"]]
-            except Exception as e:
-                print(f"Failed to load incognito connections: {e}")
+        try:
+            data = _loads(incognito_path.read_bytes())
+            if isinstance(data, dict) and data.get("version") == self.INCOGNITO_VERSION:
+                return [SSHConnection.from_dict(conn) for conn in data["connections"]]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to load incognito connections: %s", e)
 
         # Fallback: generate deterministically from full service catalog
         fake_conns = []
@@ -899,7 +1058,8 @@ class MainWindow(QMainWindow):
             fake_id = f"incognito-{icon_name}-{i}"
 
             # Ensure we cycle through services correctly
-            name, host, user, group, icon, _ = self._get_fake_data(fake_id, service_index=i)
+            # The port always comes from the base id, even if the identity is re-rolled
+            name, host, user, group, icon, fake_port = self._get_fake_data(fake_id, service_index=i)
 
             # Handle potential identity collisions
             counter = 1
@@ -911,9 +1071,6 @@ class MainWindow(QMainWindow):
 
             used_identities.add((name, host))
 
-            # Use deterministic port
-            _, _, _, _, _, fake_port = self._get_fake_data(fake_id, service_index=i)
-
             fake_conn = SSHConnection(
                 name=name,
                 host=host,
@@ -927,15 +1084,14 @@ class MainWindow(QMainWindow):
 
         # Save generated connections for consistency
         try:
-            config_dir.mkdir(parents=True, exist_ok=True)
+            incognito_path.parent.mkdir(parents=True, exist_ok=True)
             output_data = {
                 "version": self.INCOGNITO_VERSION,
                 "connections": [c.to_dict() for c in fake_conns],
             }
-            with open(incognito_path, "w") as f:
-                json.dump(output_data, f, indent=4)
+            incognito_path.write_bytes(_dumps(output_data))
         except Exception as e:
-            print(f"Failed to save incognito connections: {e}")
+            logger.warning("Failed to save incognito connections: %s", e)
 
         return fake_conns
 
@@ -952,9 +1108,10 @@ class MainWindow(QMainWindow):
             Tuple of (name, host, user, group, icon, port)
         """
 
-        seed = int(hashlib.md5(connection_id.encode()).hexdigest(), 16)
-
-        users = ["admin", "root", "pi", "user", "manager", "maintainer", "sysop", "dev"]
+        # Only used as a seed: 8 raw digest bytes, no hex round-trip
+        seed = int.from_bytes(
+            hashlib.blake2b(connection_id.encode(), digest_size=8).digest(), "big"
+        )
 
         # Use service_index if provided to ensure distribution, otherwise fallback to seed
         idx = service_index if service_index is not None else seed
@@ -967,19 +1124,11 @@ class MainWindow(QMainWindow):
         # Generate deterministic local IP
         host_byte = (seed >> 16) % 254 + 1
 
-        # Assign subnet based on seed
-        ip_prefix = seed % 3
-        if ip_prefix == 0:
-            subnet = (seed >> 12) % 10  # More variety in subnets
-            host = f"192.168.{subnet}.{host_byte}"
-        elif ip_prefix == 1:
-            subnet = (seed >> 12) % 50
-            host = f"10.0.{subnet}.{host_byte}"
-        else:
-            subnet = (seed >> 12) % 32
-            host = f"172.16.{subnet}.{host_byte}"
+        # Assign private range and subnet based on seed
+        network, subnet_count = self.INCOGNITO_NETWORKS[seed % len(self.INCOGNITO_NETWORKS)]
+        host = f"{network}.{(seed >> 12) % subnet_count}.{host_byte}"
 
-        user = users[seed % len(users)]
+        user = self.INCOGNITO_USERS[seed % len(self.INCOGNITO_USERS)]
 
         # Generate deterministic port
         port = 1024 + (seed % (65535 - 1024 + 1))
@@ -1032,15 +1181,57 @@ class MainWindow(QMainWindow):
         """Save window state and geometry."""
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("windowState", self.saveState())
-        self.settings.setValue("columnState", self.tree.header().saveState())
+        self._save_column_state()
+        self.settings.sync()
+
+    def _save_column_state(self):
+        """Persist the tree header state if it changed since the last save."""
+        state = self.tree.header().saveState()
+        if state != self._column_state:
+            self.settings.setValue("columnState", state)
+            self._column_state = state
 
     def _load_connections(self):
         """Load connections from storage and populate tree."""
-        self.connections = self.storage.load_connections()
+        self._load_generation += 1
+        self._show_connections(self.storage.load_connections())
+
+    def _load_connections_async(self):
+        """Load connections on a pool thread so reading the file does not block painting."""
+        self._load_generation += 1
+        task = _LoadConnectionsTask(self.storage, self._load_generation)
+        task.signals.loaded.connect(self._on_connections_loaded)
+        # Keep the task (and its signals object) alive until it reports back
+        self._load_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_connections_loaded(self, generation: int, result):
+        """Show connections read by _LoadConnectionsTask unless a newer load superseded them."""
+        if generation != self._load_generation:
+            return
+        self._load_task = None
+        if result is None:
+            # Let the synchronous path report the error and reset the storage cache
+            connections = self.storage.load_connections()
+        else:
+            connections = self.storage.adopt_connections(*result)
+
+        if self.incognito_mode:
+            # Incognito was switched on before the load finished; keep the fake tree
+            self._real_connections = connections
+            return
+        self._show_connections(connections)
+
+    def _show_connections(self, connections: list[SSHConnection]):
+        """Replace the loaded connections and repopulate the tree."""
+        self.connections = connections
+        self._grouped_cache = None
+        # Queue every missing icon up front; the per-row get_icon calls then coalesce
+        self.icon_manager.fetch_icons(conn.icon for conn in connections if conn.icon)
         self._populate_tree()
         # Reapply search filter if search text exists
         if self.search_bar.text():
-            self._on_search_text_changed(self.search_bar.text())
+            self._apply_search_filter(self.search_bar.text())
 
     def _find_connection_by_id(self, connection_id: str) -> SSHConnection | None:
         """Find a loaded connection by ID."""
@@ -1121,117 +1312,354 @@ class MainWindow(QMainWindow):
 
     def _populate_tree(self):
         """Populate tree widget with connections grouped by category."""
-        self.tree.clear()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tree):
+                self._build_tree()
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
-        # Group connections by group name
-        grouped_conns: dict[str, list[SSHConnection]] = {}
-        for conn in self.connections:
-            group_name = conn.group or self.tr("Default")
-            if group_name not in grouped_conns:
-                grouped_conns[group_name] = []
-            grouped_conns[group_name].append(conn)
+        # Selection signals were blocked while the old items were cleared
+        self._on_selection_changed()
+
+    def _build_tree(self):
+        """Rebuild the tree items and search index from self.connections."""
+        self.tree.clear()
 
-        # Define standard icons
-        folder_icon = qta.icon("fa5s.folder", color=self.icon_color)
-        server_icon = qta.icon("fa5s.server", color=self.icon_color)
+        grouped_conns = self._grouped_connections()
+        folder_icon = self._icons["folder"]
 
         # Map path -> QTreeWidgetItem
         group_items: dict[str, QTreeWidgetItem] = {}
+        # Items are built detached and inserted per parent in one call; "" is the root
+        children: dict[str, list[QTreeWidgetItem]] = {"": []}
+        # Icon value -> (icon, is_custom); rows sharing an icon resolve it once per rebuild
+        resolved_icons: dict[str, tuple[QIcon | None, bool]] = {}
+
+        self._group_items = group_items
+        self._conn_id_to_item = {}
+        self._items_by_icon_name = {}
+        self._search_index = []
+
+        for group_name, group_conns in grouped_conns.items():
+            # Walk up only as far as the first group that already exists
+            missing_paths = []
+            path = group_name
+            while path and path not in group_items:
+                missing_paths.append(path)
+                path = path.rpartition("/")[0]
+
+            for path in reversed(missing_paths):
+                parent_path, _, part = path.rpartition("/")
+
+                item = QTreeWidgetItem()
+                item.setText(0, part)
+                item.setIcon(0, folder_icon)
+                item.setData(0, Qt.ItemDataRole.UserRole, None)
+                group_items[path] = item
+                children[path] = []
+                children[parent_path].append(item)
 
-        for group_name in sorted(grouped_conns.keys()):
-            parts = group_name.split("/")
-            current_path = ""
+            # Add connections to this group
+            group_children = children[group_name]
+            for conn in group_conns:
+                group_children.append(
+                    self._create_connection_item(conn, group_name, resolved_icons)
+                )
 
-            for part in parts:
-                prev_path = current_path
-                current_path = f"{current_path}/{part}" if current_path else part
+        for path, group_item in group_items.items():
+            group_item.addChildren(children[path])
+        self.tree.addTopLevelItems(children[""])
+        # One recursive pass; connection rows have no children so only groups open
+        self.tree.expandAll()
 
-                if current_path not in group_items:
-                    # Create item
-                    parent_item = group_items[prev_path] if prev_path else self.tree
+        self._rebuild_search_haystack()
+        # Fresh items are all visible; the next search starts from the full index
+        self._search_text = ""
+        self._search_matches = self._search_index
 
-                    item = QTreeWidgetItem(parent_item)
-                    item.setText(0, part)
-                    item.setIcon(0, folder_icon)
-                    item.setExpanded(True)
-                    item.setData(0, Qt.ItemDataRole.UserRole, None)
-                    group_items[current_path] = item
+    def _grouped_connections(self) -> dict[str, list[SSHConnection]]:
+        """Return self.connections grouped by group name, cached until they change.
 
-            # Add connections to this group
-            group_item = group_items[group_name]
-            for conn in sorted(grouped_conns[group_name], key=lambda c: c.name):
-                conn_item = QTreeWidgetItem(group_item)
-
-                conn_item.setText(0, conn.name)
-                conn_item.setText(1, conn.host)
-                conn_item.setText(2, conn.user)
-                conn_item.setText(3, str(conn.port))
-
-                # Set icon
-                if conn.icon:
-                    custom_icon_path = self._custom_icon_path(conn.icon)
-                    if custom_icon_path:
-                        conn_item.setIcon(0, QIcon(str(custom_icon_path)))
-                    else:
-                        icon = self.icon_manager.get_icon(conn.icon)
-                        if icon:
-                            conn_item.setIcon(0, icon)
-                        else:
-                            conn_item.setIcon(0, server_icon)
-                else:
-                    conn_item.setIcon(0, server_icon)
+        Groups are in name order and each group's connections are sorted by name,
+        so one sort serves every rebuild until the connections change.
+        """
+        if self._grouped_cache is None:
+            default_group = self.tr("Default")
 
-                conn_item.setData(0, Qt.ItemDataRole.UserRole, conn)
-                if self.incognito_mode:
-                    conn_item.setToolTip(0, self.tr("Incognito mode active"))
+            def group_of(conn: SSHConnection) -> str:
+                return conn.group or default_group
+
+            ordered = sorted(self.connections, key=lambda c: (group_of(c), c.name))
+            self._grouped_cache = {
+                group_name: list(conns)
+                for group_name, conns in itertools.groupby(ordered, key=group_of)
+            }
+        return self._grouped_cache
+
+    def _create_connection_item(
+        self,
+        conn: SSHConnection,
+        group_name: str,
+        resolved_icons: dict[str, tuple[QIcon | None, bool]],
+    ) -> QTreeWidgetItem:
+        """Build a detached row for a connection and register it in the lookup tables."""
+        server_icon = self._icons["server"]
+        conn_item = QTreeWidgetItem()
+
+        conn_item.setText(0, conn.name)
+        conn_item.setText(1, conn.host)
+        conn_item.setText(2, conn.user)
+        conn_item.setText(3, str(conn.port))
+
+        # Set icon
+        if conn.icon:
+            if conn.icon not in resolved_icons:
+                resolved_icons[conn.icon] = self._resolve_connection_icon(conn.icon)
+            icon, is_custom = resolved_icons[conn.icon]
+            conn_item.setIcon(0, icon or server_icon)
+            if not is_custom:
+                self._items_by_icon_name.setdefault(conn.icon, []).append(conn_item)
+        else:
+            conn_item.setIcon(0, server_icon)
+
+        conn_item.setData(0, Qt.ItemDataRole.UserRole, conn)
+        # Real tooltips are filled in on first hover, see _on_item_entered
+        if self.incognito_mode:
+            conn_item.setToolTip(0, self._incognito_tooltip)
+
+        self._conn_id_to_item.setdefault(conn.id, []).append(conn_item)
+        self._search_index.append((conn.name.lower(), conn.host.lower(), conn_item, group_name))
+        return conn_item
+
+    def _rebuild_search_haystack(self):
+        """Rebuild the joined search string and row offsets from the search index."""
+        # One "name\0host\n..." string so a full search is a few C-level find() calls
+        self._search_haystack = "".join(
+            f"{name}\0{host}\n" for name, host, _, _ in self._search_index
+        )
+        self._search_offsets = []
+        offset = 0
+        for name, host, _, _ in self._search_index:
+            self._search_offsets.append(offset)
+            offset += len(name) + len(host) + 2
+
+    def _refresh_search_after_edit(self):
+        """Re-run the current filter after rows were added or removed in place."""
+        self._rebuild_search_haystack()
+        # Restore the invariant that _search_matches holds exactly the visible rows
+        self._search_text = ""
+        self._search_matches = [entry for entry in self._search_index if not entry[2].isHidden()]
+        self._apply_search_filter(self.search_bar.text())
+
+    def _insert_connection(self, conn: SSHConnection) -> bool:
+        """Insert a row for a new connection into its existing group.
+
+        Returns:
+            False if the group does not exist yet and the tree needs a rebuild
+        """
+        group_name = conn.group or self.tr("Default")
+        group_item = self._group_items.get(group_name)
+        if group_item is None:
+            return False
+
+        # Connections come before subgroups and are ordered by name, like _build_tree
+        row = 0
+        while row < group_item.childCount():
+            sibling = group_item.child(row).data(0, Qt.ItemDataRole.UserRole)
+            if sibling is None or sibling.name > conn.name:
+                break
+            row += 1
+
+        group_item.insertChild(row, self._create_connection_item(conn, group_name, {}))
+        return True
+
+    def _remove_connection_item(self, connection_id: str):
+        """Remove every row for a connection id, and any groups left empty, from the tree."""
+        for item in self._conn_id_to_item.pop(connection_id, []):
+            self._remove_item(item)
+
+    def _remove_item(self, item: QTreeWidgetItem):
+        """Remove one connection row, and any groups left empty, from the tree."""
+        # The dialog edits connections in place, so look the row up by identity
+        group_path = ""
+        for entry in self._search_index:
+            if entry[2] is item:
+                group_path = entry[3]
+                break
+        self._search_index = [entry for entry in self._search_index if entry[2] is not item]
+        for name, rows in list(self._items_by_icon_name.items()):
+            remaining = [row for row in rows if row is not item]
+            if len(remaining) != len(rows):
+                if remaining:
+                    self._items_by_icon_name[name] = remaining
                 else:
-                    conn_item.setToolTip(0, str(conn))
+                    del self._items_by_icon_name[name]
+
+        parent = item.parent()
+        parent.removeChild(item)
+
+        # Drop groups that no longer hold anything, walking up the path
+        while group_path and parent is not None and parent.childCount() == 0:
+            grandparent = parent.parent()
+            if grandparent is None:
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(parent))
+            else:
+                grandparent.removeChild(parent)
+            self._group_items.pop(group_path, None)
+            group_path = group_path.rpartition("/")[0]
+            parent = grandparent
+
+    def _on_connection_added(self, connection: SSHConnection):
+        """Show a newly saved connection without reloading the whole tree."""
+        self.connections.append(connection)
+        self._grouped_cache = None
+        # A brand-new group changes sibling order; rebuilding is simpler than placing it
+        if not self._insert_connection(connection):
+            self._rebuild_tree_keeping_search()
+            return
+        self._refresh_search_after_edit()
+
+    def _on_connection_updated(self, connection: SSHConnection):
+        """Move or refresh an edited connection's row in place."""
+        for index, existing in enumerate(self.connections):
+            if existing.id == connection.id:
+                self.connections[index] = connection
+                break
+        self._grouped_cache = None
+        # With duplicate ids only the first connection was replaced; rebuild to keep the rest
+        if len(self._conn_id_to_item.get(connection.id, ())) > 1:
+            self._rebuild_tree_keeping_search()
+            return
+        self._remove_connection_item(connection.id)
+        if not self._insert_connection(connection):
+            self._rebuild_tree_keeping_search()
+            return
+        self._refresh_search_after_edit()
+
+    def _on_connection_deleted(self, connection_id: str):
+        """Drop a deleted connection's row without reloading the whole tree."""
+        self.connections = [c for c in self.connections if c.id != connection_id]
+        self._grouped_cache = None
+        self._remove_connection_item(connection_id)
+        self._refresh_search_after_edit()
+
+    def _rebuild_tree_keeping_search(self):
+        """Repopulate the tree from memory and reapply any active search."""
+        self._populate_tree()
+        if self.search_bar.text():
+            self._apply_search_filter(self.search_bar.text())
+
+    def _resolve_connection_icon(self, icon_value: str) -> tuple[QIcon | None, bool]:
+        """Return the icon for a connection's icon value and whether it is a custom file."""
+        custom_icon_path = self._custom_icon_path(icon_value)
+        if custom_icon_path:
+            return QIcon(str(custom_icon_path)), True
+        return self.icon_manager.get_icon(icon_value), False
 
     def _on_icon_loaded(self, name: str, path: str):
-        """Handle icon loaded signal and update tree items."""
-        it = QTreeWidgetItemIterator(self.tree)
-        while it.value():
-            item = it.value()
-            conn = item.data(0, Qt.ItemDataRole.UserRole)
-            if conn and conn.icon == name:
-                item.setIcon(0, QIcon(path))
-            it += 1
+        """Queue a downloaded icon for the next batched tree update."""
+        self._pending_icon_loads[name] = path
+        if not self._icon_load_timer.isActive():
+            self._icon_load_timer.start()
+
+    def _apply_pending_icon_loads(self):
+        """Set every queued icon on its tree items in a single pass."""
+        pending, self._pending_icon_loads = self._pending_icon_loads, {}
+        if not pending:
+            return
+
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for name in pending:
+                # The manager's shared QIcon, so rows and later rebuilds reuse one decoded pixmap
+                icon = self.icon_manager.get_icon(name)
+                if icon is None:
+                    continue
+                for item in self._items_by_icon_name.get(name, ()):
+                    item.setIcon(0, icon)
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def _on_item_entered(self, item: QTreeWidgetItem, column: int):
-        """Update cursor based on item type."""
+        """Update cursor based on item type and fill in the tooltip on first hover."""
         connection = item.data(0, Qt.ItemDataRole.UserRole)
         if connection is None:  # It's a group
             self.tree.setCursor(Qt.CursorShape.PointingHandCursor)
         else:
             self.tree.setCursor(Qt.CursorShape.ArrowCursor)
+            if not item.toolTip(0):
+                item.setToolTip(0, str(connection))
+
+    def _match_search_index(self, text: str) -> list[tuple[str, str, QTreeWidgetItem, str]]:
+        """Return the search index rows whose name or host contains text."""
+        if not text:
+            return self._search_index
+
+        haystack = self._search_haystack
+        offsets = self._search_offsets
+        matches = []
+        pos = haystack.find(text)
+        while pos != -1:
+            row = bisect.bisect_right(offsets, pos) - 1
+            matches.append(self._search_index[row])
+            # Skip the rest of this row so each connection is reported once
+            next_row = row + 1
+            if next_row == len(offsets):
+                break
+            pos = haystack.find(text, offsets[next_row])
+        return matches
 
     def _on_search_text_changed(self, text: str):
+        """Schedule a filter pass, or clear the filter straight away."""
+        if text:
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self._apply_search_filter(text)
+
+    def _apply_search_filter(self, text: str):
         """Filter tree items based on search text."""
         text = text.lower()
-        it = QTreeWidgetItemIterator(self.tree)
-        while it.value():
-            item = it.value()
-            connection = item.data(0, Qt.ItemDataRole.UserRole)
 
-            if connection:
-                # It's a connection item
-                matches = text in connection.name.lower() or text in connection.host.lower()
-                item.setHidden(not matches)
-
-                # If matches, we need to make sure all parents are visible
-                if matches:
-                    parent = item.parent()
-                    while parent:
-                        parent.setHidden(False)
-                        parent = parent.parent()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            # Typing more characters can only narrow the previous matches
+            if self._search_text and text.startswith(self._search_text):
+                matches = []
+                for entry in self._search_matches:
+                    name, host, item, _ = entry
+                    if text in name or text in host:
+                        matches.append(entry)
+                    else:
+                        item.setHidden(True)
             else:
-                # Handle group items visibility
-                if not text:
-                    item.setHidden(False)
-                else:
-                    item.setHidden(True)
+                # Only rows whose state flips need touching; visible rows are
+                # exactly the previous matches
+                matches = self._match_search_index(text)
+                previous = {id(entry) for entry in self._search_matches}
+                current = {id(entry) for entry in matches}
+                for entry in self._search_matches:
+                    if id(entry) not in current:
+                        entry[2].setHidden(True)
+                for entry in matches:
+                    if id(entry) not in previous:
+                        entry[2].setHidden(False)
+
+            # Show a group only if it (or a subgroup) holds a match
+            visible_groups: set[str] = set()
+            if text:
+                for _, _, _, group_path in matches:
+                    while group_path and group_path not in visible_groups:
+                        visible_groups.add(group_path)
+                        group_path = group_path.rpartition("/")[0]
+            for group_path, group_item in self._group_items.items():
+                group_item.setHidden(bool(text) and group_path not in visible_groups)
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
-            it += 1
+        self._search_text = text
+        self._search_matches = matches
 
     def _on_selection_changed(self):
         """Handle tree selection changes."""
@@ -1339,7 +1767,10 @@ class MainWindow(QMainWindow):
             if connection:
                 self.storage.add_connection(connection)
                 self._cleanup_orphan_custom_icons()
-                self._load_connections()
+                if self.incognito_mode:
+                    self._load_connections()
+                else:
+                    self._on_connection_added(connection)
 
     def _clone_connection(self, item: QTreeWidgetItem | None = None):
         """Show clone connection dialog for selected connection.
@@ -1377,7 +1808,10 @@ class MainWindow(QMainWindow):
             if cloned_connection:
                 self.storage.add_connection(cloned_connection)
                 self._cleanup_orphan_custom_icons()
-                self._load_connections()
+                if self.incognito_mode:
+                    self._load_connections()
+                else:
+                    self._on_connection_added(cloned_connection)
 
     def _edit_connection(self, item: QTreeWidgetItem | None = None):
         """Show edit connection dialog for selected connection.
@@ -1404,7 +1838,10 @@ class MainWindow(QMainWindow):
             if updated_connection:
                 self.storage.update_connection(updated_connection)
                 self._cleanup_orphan_custom_icons()
-                self._load_connections()
+                if self.incognito_mode:
+                    self._load_connections()
+                else:
+                    self._on_connection_updated(updated_connection)
 
     def _delete_connection(self, item: QTreeWidgetItem | None = None):
         """Delete selected connection after confirmation.
@@ -1433,7 +1870,10 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.storage.delete_connection(connection.id)
             self._cleanup_orphan_custom_icons()
-            self._load_connections()
+            if self.incognito_mode:
+                self._load_connections()
+            else:
+                self._on_connection_deleted(connection.id)
 
     def _connect_to_selected_server(self):
         """Launch SSH connection for the currently selected server."""
@@ -1483,36 +1923,51 @@ class MainWindow(QMainWindow):
             return
 
         # Background credential check if password/key provided
-        verify_credentials = self.settings.value("verify_credentials", "true") == "true"
-        if verify_credentials and (connection.password or connection.key_path):
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            try:
-                # Force a UI update to show the cursor
-                QApplication.processEvents()
-
-                auth_success, auth_error = SSHLauncher.check_credentials(connection)
-                if (
-                    not auth_success
-                    and auth_error
-                    and SSHLauncher.is_host_key_mismatch_error(auth_error)
-                    and self._prompt_trust_changed_host_key(connection, auth_error)
-                ):
-                    auth_success, auth_error = SSHLauncher.check_credentials(connection)
-
-                if not auth_success:
-                    QApplication.restoreOverrideCursor()
-                    QMessageBox.critical(
-                        self,
-                        self.tr("Authentication Failed"),
-                        self.tr("Failed to authenticate for {}.\n\n{}'").format(
-                            connection.name, auth_error
-                        ),
-                    )
-                    return
-            finally:
-                QApplication.restoreOverrideCursor()
+        if self._verify_credentials and (connection.password or connection.key_path):
+            self._start_credential_check(connection)
+            return
+
+        self._launch_connection(connection)
+
+    def _start_credential_check(self, connection: SSHConnection, retried: bool = False):
+        """Check credentials on a pool thread; _on_credentials_checked continues the launch."""
+        if connection.id in self._credential_checks:
+            return  # Already checking this connection
 
-        # Launch connection (shell or tunnel)
+        task = _CredentialCheckTask(connection)
+        task.signals.finished.connect(self._on_credentials_checked)
+        # Keep the task (and its signals object) alive until it reports back
+        self._credential_checks[connection.id] = (task, retried)
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_credentials_checked(self, connection: SSHConnection, success: bool, error):
+        """Launch the connection once its credentials check out, or report the failure."""
+        _, retried = self._credential_checks.pop(connection.id, (None, False))
+        QApplication.restoreOverrideCursor()
+
+        if (
+            not success
+            and error
+            and not retried
+            and SSHLauncher.is_host_key_mismatch_error(error)
+            and self._prompt_trust_changed_host_key(connection, error)
+        ):
+            self._start_credential_check(connection, retried=True)
+            return
+
+        if not success:
+            QMessageBox.critical(
+                self,
+                self.tr("Authentication Failed"),
+                self.tr("Failed to authenticate for {}.\n\n{}'").format(connection.name, error),
+            )
+            return
+
+        self._launch_connection(connection)
+
+    def _launch_connection(self, connection: SSHConnection):
+        """Launch a shell or tunnel for a connection that passed its checks."""
         if connection.connection_type == "tunnel":
             # Launch tunnel in background
             success, error = SSHLauncher.launch_tunnel(connection)
@@ -1580,29 +2035,21 @@ class MainWindow(QMainWindow):
 
         menu = QMenu()
 
-        connect_action = menu.addAction(
-            qta.icon("fa5s.rocket", color=self.icon_color), self.tr("Connect")
-        )
+        connect_action = menu.addAction(self._icons["rocket"], self.tr("Connect"))
         connect_action.triggered.connect(lambda: self._connect_to_server(item))
 
-        test_action = menu.addAction(
-            qta.icon("fa5s.flask", color=self.icon_color), self.tr("Test Connection")
-        )
+        test_action = menu.addAction(self._icons["flask"], self.tr("Test Connection"))
         test_action.triggered.connect(lambda: self._test_connection(item))
 
         menu.addSeparator()
 
-        clone_action = menu.addAction(
-            qta.icon("fa5s.clone", color=self.icon_color), self.tr("Clone")
-        )
+        clone_action = menu.addAction(self._icons["clone"], self.tr("Clone"))
         clone_action.triggered.connect(lambda: self._clone_connection(item))
 
-        edit_action = menu.addAction(qta.icon("fa5s.edit", color=self.icon_color), self.tr("Edit"))
+        edit_action = menu.addAction(self._icons["edit"], self.tr("Edit"))
         edit_action.triggered.connect(lambda: self._edit_connection(item))
 
-        delete_action = menu.addAction(
-            qta.icon("fa5s.trash", color=self.icon_color), self.tr("Delete")
-        )
+        delete_action = menu.addAction(self._icons["trash"], self.tr("Delete"))
         delete_action.triggered.connect(lambda: self._delete_connection(item))
 
         menu.exec(self.tree.viewport().mapToGlobal(position))
@@ -1628,7 +2075,7 @@ class MainWindow(QMainWindow):
         """Hide a column and update stretch behavior."""
         self.tree.setColumnHidden(column, True)
         self._update_column_stretch()
-        self.settings.setValue("columnState", self.tree.header().saveState())
+        self._save_column_state()
 
     def _show_settings_dialog(self):
         """Show the settings dialog."""
@@ -1649,6 +2096,7 @@ class MainWindow(QMainWindow):
             self.settings.setValue(
                 "verify_credentials", str(settings["verify_credentials"]).lower()
             )
+            self._verify_credentials = settings["verify_credentials"]
 
             # Update updater setting
             self.settings.setValue(
@@ -1705,7 +2153,12 @@ class MainWindow(QMainWindow):
             self._update_column_stretch()
 
             # Save column state
-            self.settings.setValue("columnState", self.tree.header().saveState())
+            self._save_column_state()
+
+    def _on_system_color_scheme_changed(self):
+        """Follow the system colour scheme when the theme preference is System."""
+        if self.settings.value("theme_preference", "System") == "System":
+            self._apply_theme()
 
     def _apply_theme(self):
         """Apply the theme based on user settings and update icons appropriately."""
@@ -1721,17 +2174,20 @@ class MainWindow(QMainWindow):
             ThemeManager.apply_theme(QApplication.instance())
             self.icon_color = "white" if ThemeManager.is_system_dark_mode() else "black"
 
+        self._icons = {name: _icon(f"fa5s.{name}", self.icon_color) for name in _THEMED_ICONS}
+
         # Update icons in UI if they already exist
         if hasattr(self, "search_bar"):
             search_action = self.search_bar.actions()[0]
-            search_action.setIcon(qta.icon("fa5s.search", color=self.icon_color))
+            search_action.setIcon(self._icons["search"])
 
-            self.settings_btn.setIcon(qta.icon("fa5s.bars", color=self.icon_color))
-            self.add_btn.setIcon(qta.icon("fa5s.plus", color=self.icon_color))
-            self.clone_btn.setIcon(qta.icon("fa5s.clone", color=self.icon_color))
-            self.edit_btn.setIcon(qta.icon("fa5s.edit", color=self.icon_color))
-            self.delete_btn.setIcon(qta.icon("fa5s.trash", color=self.icon_color))
-            self.connect_btn.setIcon(qta.icon("fa5s.rocket", color=self.icon_color))
+            self.settings_btn.setIcon(self._icons["bars"])
+            self.add_btn.setIcon(self._icons["plus"])
+            self.clone_btn.setIcon(self._icons["clone"])
+            self.edit_btn.setIcon(self._icons["edit"])
+            self.delete_btn.setIcon(self._icons["trash"])
+            self.test_btn.setIcon(self._icons["flask"])
+            self.connect_btn.setIcon(self._icons["rocket"])
 
             # Repopulate tree to refresh folder/server icons
             self._populate_tree()
@@ -1841,8 +2297,8 @@ class MainWindow(QMainWindow):
         select_files = msg.addButton(self.tr("Select Files"), QMessageBox.ButtonRole.ActionRole)
         browse_folder = msg.addButton(self.tr("Browse Folder"), QMessageBox.ButtonRole.ActionRole)
         cancel_btn = msg.addButton(QMessageBox.StandardButton.Cancel)
-        select_files.setIcon(qta.icon("fa5s.file", color=self.icon_color))
-        browse_folder.setIcon(qta.icon("fa5s.folder-open", color=self.icon_color))
+        select_files.setIcon(_icon("fa5s.file", self.icon_color))
+        browse_folder.setIcon(_icon("fa5s.folder-open", self.icon_color))
         msg.setDefaultButton(cancel_btn)
 
         msg.exec()
@@ -1894,8 +2350,8 @@ class MainWindow(QMainWindow):
         add_new = msg.addButton(self.tr("Add to Existing"), QMessageBox.ButtonRole.ActionRole)
         replace_all = msg.addButton(self.tr("Replace All"), QMessageBox.ButtonRole.DestructiveRole)
         cancel_btn = msg.addButton(QMessageBox.StandardButton.Cancel)
-        add_new.setIcon(qta.icon("fa5s.plus", color=self.icon_color))
-        replace_all.setIcon(qta.icon("fa5s.exclamation-triangle", color="#f0ad4e"))
+        add_new.setIcon(self._icons["plus"])
+        replace_all.setIcon(_icon("fa5s.exclamation-triangle", "#f0ad4e"))
         msg.setDefaultButton(cancel_btn)
 
         msg.exec()
@@ -1979,7 +2435,7 @@ class MainWindow(QMainWindow):
                 except FileNotFoundError:
                     subprocess.Popen(["open", str(config_dir)])
         except (OSError, subprocess.SubprocessError) as e:
-            print(f"Error opening folder: {e}")
+            logger.warning("Error opening folder: %s", e)
             QMessageBox.warning(
                 self,
                 self.tr("Could Not Open Folder"),
@@ -1,21 +1,240 @@
 """Theme management for dark/light mode."""
 
-from PySide6.QtCore import Qt
+import functools
+
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtGui import QColor, QGuiApplication, QPalette
 from PySide6.QtWidgets import QApplication
 
+_DARK_QSS = """
+QTreeView {
+    selection-background-color: #505050;
+    selection-color: white;
+    show-decoration-selected: 1;
+    outline: none;
+    border: none;
+}
+QHeaderView::section {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    padding: 4px 6px;
+    border: 1px solid #505050;
+    border-top: none;
+    border-left: none;
+}
+QHeaderView::section:last {
+    border-right: none;
+}
+QLineEdit {
+    padding: 4px 8px;
+    border: 1px solid #505050;
+    border-radius: 4px;
+    background-color: #3d3d3d;
+    color: #ffffff;
+    selection-background-color: #505050;
+}
+QLineEdit::placeholder {
+    color: #888888;
+}
+QLineEdit:focus {
+    border-color: #4282da;
+}
+QToolButton {
+}
+QPushButton {
+    padding: 5px 15px;
+    border-radius: 4px;
+    border: 1px solid #505050;
+    background-color: #3d3d3d;
+}
+QPushButton:hover {
+    background-color: #505050;
+    border-color: #606060;
+}
+QPushButton:pressed {
+    background-color: #303030;
+}
+QPushButton:disabled {
+    border-color: #353535;
+    background-color: #353535;
+    color: #7f7f7f;
+}
+"""
+
+_LIGHT_QSS = """
+QTreeView {
+    show-decoration-selected: 1;
+    outline: none;
+    border: none;
+}
+QPushButton {
+    padding: 5px 15px;
+    border-radius: 4px;
+    border: 1px solid rgba(0, 0, 0, 0.2);
+}
+QPushButton:hover {
+    background-color: rgba(0, 0, 0, 0.05);
+    border-color: rgba(0, 0, 0, 0.3);
+}
+QPushButton:pressed {
+    background-color: rgba(0, 0, 0, 0.15);
+}
+QPushButton:disabled {
+    border-color: rgba(0, 0, 0, 0.1);
+    background-color: rgba(0, 0, 0, 0.05);
+}
+QLineEdit {
+    padding: 4px 8px;
+    border: 1px solid rgba(0, 0, 0, 0.3);
+    border-radius: 4px;
+    color: #000000;
+}
+QLineEdit::placeholder {
+    color: #666666;
+}
+QLineEdit:focus {
+    border-color: #0078D7;
+}
+QHeaderView::section {
+    background-color: #e0e0e0;
+    color: #000000;
+    padding: 4px 6px;
+    border: 1px solid #cccccc;
+    border-top: none;
+    border-left: none;
+}
+QHeaderView::section:last {
+    border-right: none;
+}
+QToolButton {
+    border: none;
+}
+"""
+
+
+@functools.cache
+def _dark_palette() -> QPalette:
+    """Build the dark palette once; QApplication.setPalette copies it."""
+    dark_palette = QPalette()
+
+    # Colors
+    dark_bg = QColor(45, 45, 45)
+    dark_fg = QColor(255, 255, 255)
+    dark_highlight = QColor(42, 130, 218)
+    dark_disabled = QColor(127, 127, 127)
+
+    dark_palette.setColor(QPalette.ColorRole.Window, dark_bg)
+    dark_palette.setColor(QPalette.ColorRole.WindowText, dark_fg)
+    dark_palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
+    dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
+    dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
+    dark_palette.setColor(QPalette.ColorRole.Text, dark_fg)
+    dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ColorRole.ButtonText, dark_fg)
+    dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    dark_palette.setColor(QPalette.ColorRole.Link, dark_highlight)
+    dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(80, 80, 80))  # subtle gray
+    dark_palette.setColor(QPalette.ColorRole.HighlightedText, dark_fg)  # white
+
+    # Disabled colors
+    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, dark_disabled)
+    dark_palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, dark_disabled
+    )
+
+    return dark_palette
+
+
+@functools.cache
+def _light_palette() -> QPalette:
+    """Build the light palette once."""
+    # Build a full Light Palette so we don't rely on the system's standard palette (which may be dark)
+    light_palette = QPalette()
+    light_palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
+    light_palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
+    light_palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
+    light_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(245, 245, 245))
+    light_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
+    light_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
+    light_palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
+    light_palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
+    light_palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
+    light_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    light_palette.setColor(QPalette.ColorRole.Link, QColor(0, 0, 255))
+
+    # Selection colors
+    light_palette.setColor(QPalette.ColorRole.Highlight, QColor(204, 232, 255))
+    light_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
+
+    # Disabled colors
+    light_disabled = QColor(127, 127, 127)
+    light_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, light_disabled)
+    light_palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, light_disabled
+    )
+    light_palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, light_disabled
+    )
+
+    return light_palette
+
+
+class _ColorSchemeWatcher(QObject):
+    """Clears the cached dark-mode result when the system colour scheme changes."""
+
+    changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        hints = QGuiApplication.styleHints()
+        # Qt 6.5+; older versions never invalidate, matching their static detection
+        if hasattr(hints, "colorSchemeChanged"):
+            hints.colorSchemeChanged.connect(self._on_color_scheme_changed)
+
+    def _on_color_scheme_changed(self, *_args):
+        ThemeManager._system_dark = None
+        self.changed.emit()
+
 
 class ThemeManager:
     """Manages application theme (dark/light mode)."""
 
+    # Theme last applied to the application, "dark" or "light"
+    _current: str | None = None
+    # Cached is_system_dark_mode() result, cleared by the colour scheme watcher
+    _system_dark: bool | None = None
+    _watcher: _ColorSchemeWatcher | None = None
+
+    @staticmethod
+    def color_scheme_watcher() -> _ColorSchemeWatcher:
+        """Return the watcher whose changed signal fires when the system scheme changes."""
+        if ThemeManager._watcher is None:
+            ThemeManager._watcher = _ColorSchemeWatcher()
+        return ThemeManager._watcher
+
     @staticmethod
     def is_system_dark_mode() -> bool:
         """Detect if system is using dark mode.
 
+        The result is cached until the system colour scheme changes.
+
         Returns:
             True if dark mode is active
         """
+        if ThemeManager._system_dark is not None:
+            return ThemeManager._system_dark
 
+        is_dark = ThemeManager._detect_system_dark_mode()
+        # Only cache once something will tell us the answer went stale
+        if QGuiApplication.instance() is not None:
+            ThemeManager.color_scheme_watcher()
+            ThemeManager._system_dark = is_dark
+        return is_dark
+
+    @staticmethod
+    def _detect_system_dark_mode() -> bool:
+        """Query Qt for the system colour scheme, falling back to palette luminance."""
         # 1. Try Qt 6.5+ style hints (most reliable)
         try:
             hints = QGuiApplication.styleHints()
@@ -56,91 +275,15 @@ class ThemeManager:
         Args:
             app: QApplication instance
         """
-        dark_palette = QPalette()
-
-        # Colors
-        dark_bg = QColor(45, 45, 45)
-        dark_fg = QColor(255, 255, 255)
-        dark_highlight = QColor(42, 130, 218)
-        dark_disabled = QColor(127, 127, 127)
-
-        dark_palette.setColor(QPalette.ColorRole.Window, dark_bg)
-        dark_palette.setColor(QPalette.ColorRole.WindowText, dark_fg)
-        dark_palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
-        dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-        dark_palette.setColor(QPalette.ColorRole.Text, dark_fg)
-        dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ButtonText, dark_fg)
-        dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        dark_palette.setColor(QPalette.ColorRole.Link, dark_highlight)
-        dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(80, 80, 80))  # subtle gray
-        dark_palette.setColor(QPalette.ColorRole.HighlightedText, dark_fg)  # white
-
-        # Disabled colors
-        dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, dark_disabled)
-        dark_palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, dark_disabled
-        )
-
-        app.setPalette(dark_palette)
+        # Re-setting the stylesheet makes Qt re-polish every widget
+        if ThemeManager._current == "dark":
+            return
+
+        app.setPalette(_dark_palette())
 
         # Additional stylesheet tweaks
-        app.setStyleSheet("""
-            QTreeView {
-                selection-background-color: #505050;
-                selection-color: white;
-                show-decoration-selected: 1;
-                outline: none;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                padding: 4px 6px;
-                border: 1px solid #505050;
-                border-top: none;
-                border-left: none;
-            }
-            QHeaderView::section:last {
-                border-right: none;
-            }
-            QLineEdit {
-                padding: 4px 8px;
-                border: 1px solid #505050;
-                border-radius: 4px;
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #505050;
-            }
-            QLineEdit::placeholder {
-                color: #888888;
-            }
-            QLineEdit:focus {
-                border-color: #4282da;
-            }
-            QToolButton {
-            }
-            QPushButton {
-                padding: 5px 15px;
-                border-radius: 4px;
-                border: 1px solid #505050;
-                background-color: #3d3d3d;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #606060;
-            }
-            QPushButton:pressed {
-                background-color: #303030;
-            }
-            QPushButton:disabled {
-                border-color: #353535;
-                background-color: #353535;
-                color: #7f7f7f;
-            }
-        """)
+        app.setStyleSheet(_DARK_QSS)
+        ThemeManager._current = "dark"
 
     @staticmethod
     def apply_light_theme(app: QApplication) -> None:
@@ -149,87 +292,12 @@ class ThemeManager:
         Args:
             app: QApplication instance
         """
-        app.setStyle("Fusion")
+        if ThemeManager._current == "light":
+            return
 
-        # Build a full Light Palette so we don't rely on the system's standard palette (which may be dark)
-        light_palette = QPalette()
-        light_palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(245, 245, 245))
-        light_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Link, QColor(0, 0, 255))
-
-        # Selection colors
-        light_palette.setColor(QPalette.ColorRole.Highlight, QColor(204, 232, 255))
-        light_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-
-        # Disabled colors
-        light_disabled = QColor(127, 127, 127)
-        light_palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, light_disabled
-        )
-        light_palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, light_disabled
-        )
-        light_palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, light_disabled
-        )
-
-        app.setPalette(light_palette)
+        app.setStyle("Fusion")
+        app.setPalette(_light_palette())
 
         # Minimal styling that doesn't break Fusion's native QTreeView drawing.
-        app.setStyleSheet("""
-            QTreeView {
-                show-decoration-selected: 1;
-                outline: none;
-                border: none;
-            }
-            QPushButton {
-                padding: 5px 15px;
-                border-radius: 4px;
-                border: 1px solid rgba(0, 0, 0, 0.2);
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 0, 0, 0.05);
-                border-color: rgba(0, 0, 0, 0.3);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 0, 0, 0.15);
-            }
-            QPushButton:disabled {
-                border-color: rgba(0, 0, 0, 0.1);
-                background-color: rgba(0, 0, 0, 0.05);
-            }
-            QLineEdit {
-                padding: 4px 8px;
-                border: 1px solid rgba(0, 0, 0, 0.3);
-                border-radius: 4px;
-                color: #000000;
-            }
-            QLineEdit::placeholder {
-                color: #666666;
-            }
-            QLineEdit:focus {
-                border-color: #0078D7;
-            }
-            QHeaderView::section {
-                background-color: #e0e0e0;
-                color: #000000;
-                padding: 4px 6px;
-                border: 1px solid #cccccc;
-                border-top: none;
-                border-left: none;
-            }
-            QHeaderView::section:last {
-                border-right: none;
-            }
-            QToolButton {
-                border: none;
-            }
-        """)
+        app.setStyleSheet(_LIGHT_QSS)
+        ThemeManager._current = "light"
@@ -13,6 +13,10 @@ def cleanup_singletons():
     except Exception:
         pass
 
+    from sshive.ssh.launcher import SSHLauncher
+
+    SSHLauncher.clear_caches()
+
 
 @pytest.fixture(autouse=True)
 def mock_settings(monkeypatch, tmp_path):
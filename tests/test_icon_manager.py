@@ -1,4 +1,23 @@
-from sshive.ui.icon_manager import IconManager, get_icon_manager
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import QByteArray
+from PySide6.QtGui import QPixmap
+from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+
+from sshive.ui.icon_manager import (
+    IconManager,
+    _content_digest,
+    _load_parsed_manifest,
+    _store_parsed_manifest,
+    get_icon_manager,
+)
+
+# conftest stubs fetch_icon for every test; keep the real one for direct tests
+_real_fetch_icon = IconManager.fetch_icon
+_real_load_manifest = IconManager._load_manifest
 
 
 def test_icon_manager_instance(qtbot):
@@ -50,3 +69,390 @@ def test_get_icon_path(qtbot, tmp_path):
 
     # Test non-existent
     assert manager.get_icon_path("non-existent") is None
+
+
+def test_parse_manifest_ignores_non_strings_and_replaces_previous(qtbot):
+    """Parsing replaces the previous set and skips non-string entries."""
+    manager = IconManager()
+    manager._parse_manifest(["old"])
+    manager._parse_manifest(["new", 42, None, {"name": "x"}])
+
+    assert manager.valid_icons == {"new"}
+
+    # Names are interned, so they are the same object as the "grafana" literal
+    manager._parse_manifest(["".join(["gra", "fana"])])
+    assert next(iter(manager.valid_icons)) is "grafana"  # noqa: F632
+
+    manager._parse_manifest({"unexpected": "shape"})
+    assert manager.valid_icons == set()
+
+
+def _manifest_reply(body: bytes, status: int = 200, etag: bytes = b""):
+    """Build a fake finished manifest reply."""
+    reply = MagicMock()
+    reply.error.return_value = QNetworkReply.NetworkError.NoError
+    reply.attribute.return_value = status
+    reply.readAll.return_value = QByteArray(body)
+    reply.rawHeader.side_effect = lambda name: QByteArray(etag if name == "ETag" else b"")
+    return reply
+
+
+def test_manifest_download_skips_parse_when_unchanged(qtbot, tmp_path):
+    """Identical manifest bytes are not re-parsed and the ETag is remembered."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    body = b'["proxmox", "grafana"]'
+
+    manager._on_manifest_downloaded(_manifest_reply(body, etag=b'"v1"'))
+    assert manager.valid_icons == {"proxmox", "grafana"}
+    assert (tmp_path / "icons.json").read_bytes() == body
+    assert (tmp_path / "icons.json.etag").read_bytes() == b'"v1"'
+
+    with patch.object(manager, "_parse_manifest") as mock_parse:
+        manager._on_manifest_downloaded(_manifest_reply(body))
+        manager._on_manifest_downloaded(_manifest_reply(b"", status=304))
+
+    mock_parse.assert_not_called()
+
+
+def test_icon_manager_defers_manifest_until_first_use(qtbot, tmp_path):
+    """Constructing the manager does no I/O; the first icon lookup does."""
+    with patch.object(IconManager, "_load_manifest") as mock_load:
+        manager = IconManager()
+        manager.cache_dir = tmp_path / "icons"
+        mock_load.assert_not_called()
+        assert not manager.cache_dir.exists()
+
+        manager.get_icon_path("proxmox")
+        manager.get_icon_path("grafana")
+
+        mock_load.assert_called_once()
+        assert manager.cache_dir.is_dir()
+
+
+def test_get_scaled_pixmap_is_cached(qtbot, tmp_path):
+    """Scaled pixmaps are decoded once and reused on later lookups."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    source = QPixmap(64, 64)
+    source.fill()
+    source.save(str(tmp_path / "proxmox.webp"), "PNG")
+
+    first = manager.get_scaled_pixmap("proxmox")
+    assert first is not None
+    assert first.width() == 32
+
+    with patch("sshive.ui.icon_manager.QPixmap") as mock_pixmap:
+        assert manager.get_scaled_pixmap("proxmox") is first
+        mock_pixmap.assert_not_called()
+
+    assert manager.get_scaled_pixmap("missing") is None
+
+
+def test_fetch_icon_skips_names_missing_from_manifest(qtbot, tmp_path):
+    """Unknown names fail immediately instead of requesting a CDN 404."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+    manager._parse_manifest(["proxmox"])
+
+    with (
+        patch.object(manager.network, "get") as mock_get,
+        qtbot.waitSignal(manager.icon_failed) as blocker,
+    ):
+        _real_fetch_icon(manager, "prox")
+
+    assert blocker.args == ["prox"]
+    mock_get.assert_not_called()
+    assert manager.is_known_icon("proxmox")
+    assert not manager.is_known_icon("prox")
+
+
+def test_fetch_icon_caps_concurrent_downloads(qtbot, tmp_path):
+    """Only MAX_CONCURRENT_DOWNLOADS requests run at once; the rest queue up."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+    names = [f"icon-{i}" for i in range(manager.MAX_CONCURRENT_DOWNLOADS + 2)]
+
+    with (
+        patch.object(manager.network, "get") as mock_get,
+        patch.object(IconManager, "fetch_icon", _real_fetch_icon),
+    ):
+        for name in names:
+            manager.fetch_icon(name)
+
+        assert mock_get.call_count == manager.MAX_CONCURRENT_DOWNLOADS
+        assert list(manager._queued) == names[-2:]
+
+        failed = MagicMock()
+        failed.property.side_effect = {"icon_name": names[0]}.get
+        failed.error.return_value = QNetworkReply.NetworkError.ContentNotFoundError
+        manager._finish_icon_reply(failed)
+
+        assert mock_get.call_count == manager.MAX_CONCURRENT_DOWNLOADS + 1
+        assert list(manager._queued) == names[-1:]
+
+
+def test_finished_download_skips_queued_icons_that_need_no_download(qtbot, tmp_path):
+    """A queued icon cached in the meantime must not stall the icons queued behind it."""
+    manager = IconManager()
+    manager.MAX_CONCURRENT_DOWNLOADS = 1
+    manager.cache_dir = tmp_path
+    manager._ready = True
+    (tmp_path / "b.webp").touch()
+    manager._inflight.add("a")
+    manager._queued.extend(["b", "c"])
+
+    with (
+        patch.object(manager.network, "get") as mock_get,
+        patch.object(IconManager, "fetch_icon", _real_fetch_icon),
+    ):
+        failed = MagicMock()
+        failed.property.side_effect = {"icon_name": "a"}.get
+        failed.error.return_value = QNetworkReply.NetworkError.ContentNotFoundError
+        manager._finish_icon_reply(failed)
+
+    mock_get.assert_called_once()
+    assert manager._inflight == {"c"}
+    assert not manager._queued
+
+
+def test_icon_download_is_written_atomically(qtbot, tmp_path):
+    """Downloaded icons replace the cache file in one step and leave no temp files."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    path = tmp_path / "proxmox.webp"
+    path.write_bytes(b"old")
+
+    reply = MagicMock()
+    reply.error.return_value = QNetworkReply.NetworkError.NoError
+    reply.readAll.return_value = QByteArray(b"new")
+
+    with patch("sshive.ui.icon_manager.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            manager._on_icon_downloaded(reply, "proxmox", path)
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["proxmox.webp"]
+
+    manager._on_icon_downloaded(reply, "proxmox", path)
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["proxmox.webp"]
+
+
+def test_cached_icons_are_found_from_one_directory_scan(qtbot, tmp_path):
+    """Lookups use one scandir of the cache dir; downloads are added to it."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    (tmp_path / "proxmox.webp").touch()
+
+    with patch("sshive.ui.icon_manager.os.scandir", wraps=os.scandir) as mock_scandir:
+        assert manager.get_icon_path("proxmox") == str(tmp_path / "proxmox.webp")
+        assert manager.get_icon_path("grafana") is None
+        assert manager.get_icon_path("proxmox") is not None
+    mock_scandir.assert_called_once()
+
+    reply = MagicMock()
+    reply.error.return_value = QNetworkReply.NetworkError.NoError
+    reply.readAll.return_value = QByteArray(b"icon")
+    manager._on_icon_downloaded(reply, "grafana", tmp_path / "grafana.webp")
+    assert manager.get_icon_path("grafana") == str(tmp_path / "grafana.webp")
+
+
+def test_fetch_icon_coalesces_duplicate_requests(qtbot, tmp_path):
+    """Asking for an icon that is already downloading or queued issues no new GET."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+
+    with patch.object(manager.network, "get") as mock_get:
+        _real_fetch_icon(manager, "proxmox")
+        _real_fetch_icon(manager, "proxmox")
+        assert mock_get.call_count == 1
+
+        manager._inflight.update(f"busy-{i}" for i in range(manager.MAX_CONCURRENT_DOWNLOADS))
+        _real_fetch_icon(manager, "grafana")
+        _real_fetch_icon(manager, "grafana")
+        assert list(manager._queued) == ["grafana"]
+        assert mock_get.call_count == 1
+
+
+def test_make_request_allows_http2_and_pooling(qtbot):
+    """Requests opt into HTTP/2 and keep idle connections for reuse."""
+    request = IconManager()._make_request(IconManager.MANIFEST_URL)
+
+    assert request.url().toString() == IconManager.MANIFEST_URL
+    assert request.attribute(QNetworkRequest.Attribute.Http2AllowedAttribute) is True
+    assert (
+        request.attribute(QNetworkRequest.Attribute.ConnectionCacheExpiryTimeoutSecondsAttribute)
+        == IconManager.CONNECTION_IDLE_SECONDS
+    )
+
+
+def test_load_manifest_reads_cached_copy(qtbot, tmp_path):
+    """The cached manifest is parsed from the mapped file and revalidated by ETag."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    body = b'["proxmox", "grafana"]'
+    (tmp_path / "icons.json").write_bytes(body)
+    (tmp_path / "icons.json.etag").write_bytes(b'"v1"')
+
+    with patch.object(manager.network, "get") as mock_get:
+        _real_load_manifest(manager)
+        qtbot.waitUntil(lambda: mock_get.called, timeout=2000)
+
+    assert manager.valid_icons == {"proxmox", "grafana"}
+    assert manager._manifest_digest == manager._digest(body)
+    request = mock_get.call_args[0][0]
+    assert request.rawHeader("If-None-Match").data() == b'"v1"'
+
+
+def test_load_manifest_reuses_stored_icon_set(qtbot, tmp_path):
+    """A warm start loads the parsed set instead of re-parsing unchanged JSON."""
+    (tmp_path / "icons.json").write_bytes(b'["proxmox", "grafana"]')
+
+    first = IconManager()
+    first.cache_dir = tmp_path
+    with patch.object(first.network, "get") as mock_get:
+        _real_load_manifest(first)
+        qtbot.waitUntil(lambda: mock_get.called, timeout=2000)
+    assert (tmp_path / "icons.txt").exists()
+
+    second = IconManager()
+    second.cache_dir = tmp_path
+    with (
+        patch.object(second.network, "get") as mock_get,
+        patch("sshive.ui.icon_manager._json_loads") as mock_loads,
+    ):
+        _real_load_manifest(second)
+        qtbot.waitUntil(lambda: mock_get.called, timeout=2000)
+    mock_loads.assert_not_called()
+    assert second.valid_icons == {"proxmox", "grafana"}
+
+    # Editing the manifest invalidates the stored set
+    (tmp_path / "icons.json").write_bytes(b'["kuma"]')
+    third = IconManager()
+    third.cache_dir = tmp_path
+    with patch.object(third.network, "get") as mock_get:
+        _real_load_manifest(third)
+        qtbot.waitUntil(lambda: mock_get.called, timeout=2000)
+    assert third.valid_icons == {"kuma"}
+
+
+def test_stored_icon_set_is_checked_against_the_digest_first(tmp_path):
+    """The stored set is plain text and only decoded for the matching manifest digest."""
+    digest = _content_digest(b'["proxmox"]')
+    _store_parsed_manifest(tmp_path, digest, frozenset({"proxmox", "grafana"}))
+
+    assert (tmp_path / "icons.txt").read_bytes().split(b"\n")[0] == digest.hex().encode()
+    assert _load_parsed_manifest(tmp_path, digest) == {"proxmox", "grafana"}
+    assert _load_parsed_manifest(tmp_path, _content_digest(b"[]")) is None
+
+    _store_parsed_manifest(tmp_path, digest, frozenset())
+    assert _load_parsed_manifest(tmp_path, digest) == frozenset()
+
+
+def test_replies_are_tracked_with_a_single_finished_connection(qtbot, tmp_path):
+    """Each reply connects only its completion handler and is still aborted on cleanup."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+
+    with patch.object(manager.network, "get") as mock_get:
+        reply = mock_get.return_value
+        reply.isRunning.return_value = True
+        _real_fetch_icon(manager, "proxmox")
+
+    reply.finished.connect.assert_called_once_with(manager._on_icon_downloaded_finished)
+    assert reply in manager.pending_replies
+
+    manager.cleanup()
+    reply.abort.assert_called_once()
+    assert not manager.pending_replies
+
+
+def test_malformed_icon_names_never_touch_disk_or_network(qtbot, tmp_path):
+    """Paths and other non-icon names are rejected before any stat or request."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+
+    with (
+        patch("sshive.ui.icon_manager.os.scandir") as mock_scandir,
+        patch.object(manager.network, "get") as mock_get,
+    ):
+        for name in ("../secret", "/home/user/icon.png", "Home Assistant", "-x"):
+            assert manager.get_icon_path(name) is None
+            assert not manager.is_known_icon(name)
+            with qtbot.waitSignal(manager.icon_failed):
+                _real_fetch_icon(manager, name)
+
+    mock_scandir.assert_not_called()
+    mock_get.assert_not_called()
+
+
+def test_get_icon_shares_one_qicon_per_name(qtbot, tmp_path):
+    """Repeated lookups return the same QIcon instead of decoding the file again."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    (tmp_path / "proxmox.webp").touch()
+
+    first = manager.get_icon("proxmox")
+    assert first is not None
+    assert manager.get_icon("proxmox") is first
+
+
+def test_icon_files_are_pruned_least_recently_used_first(qtbot, tmp_path):
+    """Once over the limit, the oldest quarter of the icon files is deleted."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager.MAX_CACHED_ICONS = 6
+    for i in range(8):
+        path = tmp_path / f"icon-{i}.webp"
+        path.touch()
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert manager.get_icon_path("icon-0") is None
+    assert manager.get_icon_path("icon-1") is None
+    assert manager.get_icon_path("icon-2") is not None
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"icon-{i}.webp" for i in range(2, 8)]
+
+
+def test_load_manifest_reads_cache_off_the_ui_thread(qtbot, tmp_path):
+    """The cached manifest is parsed on a pool thread; the UI thread only applies it."""
+    (tmp_path / "icons.json").write_bytes(b'["proxmox"]')
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    parse_threads = []
+
+    def record_thread(data):
+        parse_threads.append(threading.current_thread())
+        return ["proxmox"]
+
+    with (
+        patch.object(manager.network, "get") as mock_get,
+        patch("sshive.ui.icon_manager._json_loads", side_effect=record_thread),
+    ):
+        _real_load_manifest(manager)
+        qtbot.waitUntil(lambda: mock_get.called, timeout=2000)
+
+    assert parse_threads and parse_threads[0] is not threading.main_thread()
+    assert manager.valid_icons == {"proxmox"}
+
+
+def test_fetch_icons_prefetches_uncached_names_through_the_queue(qtbot, tmp_path):
+    """Bulk prefetch skips cached and repeated names and respects the download cap."""
+    manager = IconManager()
+    manager.cache_dir = tmp_path
+    manager._ready = True
+    (tmp_path / "proxmox.webp").touch()
+    names = [f"icon-{i}" for i in range(manager.MAX_CONCURRENT_DOWNLOADS + 1)]
+
+    with (
+        patch.object(manager.network, "get") as mock_get,
+        patch.object(IconManager, "fetch_icon", _real_fetch_icon),
+    ):
+        manager.fetch_icons(["proxmox", *names, names[0], "/home/user/icon.png"])
+
+    assert mock_get.call_count == manager.MAX_CONCURRENT_DOWNLOADS
+    assert list(manager._queued) == names[-1:]
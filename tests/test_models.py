@@ -138,6 +138,21 @@ class TestSSHConnection:
         assert "-p" in cmd
         assert "2222" in cmd
 
+    def test_ssh_argv_is_cached_until_fields_change(self):
+        """The argv is reused across calls and rebuilt after host/port edits."""
+        conn = SSHConnection(name="Test", host="example.com", user="testuser")
+
+        assert conn.ssh_argv is conn.ssh_argv
+        conn.get_ssh_command().append("extra")
+        assert conn.ssh_argv == ("ssh", "testuser@example.com")
+
+        conn.port = 2222
+        conn.host = "other.example.com"
+        assert conn.ssh_argv == ("ssh", "-p", "2222", "testuser@other.example.com")
+        assert conn == SSHConnection(
+            name="Test", host="other.example.com", user="testuser", port=2222, id=conn.id
+        )
+
     def test_str_representation(self):
         """Test string representation."""
         conn = SSHConnection(name="My Server", host="example.com", user="testuser", port=22)
@@ -1,6 +1,8 @@
 """Tests for connection storage."""
 
 import json
+import os
+import stat
 import tempfile
 import time
 from pathlib import Path
@@ -106,6 +108,29 @@ class TestConnectionStorage:
         assert len(loaded) == 1
         assert loaded[0].name == "Keep"
 
+    def test_delete_connection_removes_duplicate_ids(self, storage):
+        """Every entry sharing the deleted id is removed, as imports can duplicate ids."""
+        keep = SSHConnection(name="Keep", host="host1.com", user="user1")
+        dupe = SSHConnection(name="Dupe", host="host2.com", user="user2")
+        twin = SSHConnection.from_dict({**dupe.to_dict(), "name": "Dupe2"})
+        storage.save_connections([dupe, keep, twin])
+
+        storage.delete_connection(dupe.id)
+
+        assert [c.name for c in storage.load_connections()] == ["Keep"]
+
+    def test_update_and_delete_preserve_order(self, storage):
+        """Test that id-indexed update/delete touch only the matching entry."""
+        conns = [SSHConnection(name=f"S{i}", host=f"h{i}.com", user="u") for i in range(4)]
+        storage.save_connections(conns)
+
+        conns[1].name = "Renamed"
+        storage.update_connection(conns[1])
+        storage.delete_connection(conns[2].id)
+
+        loaded = storage.load_connections()
+        assert [conn.name for conn in loaded] == ["S0", "Renamed", "S3"]
+
     def test_get_groups(self, storage):
         """Test getting unique group names."""
         connections = [
@@ -122,6 +147,16 @@ class TestConnectionStorage:
         assert "Work" in groups
         assert "Personal" in groups
 
+    def test_get_groups_reflects_external_changes(self, temp_config):
+        """Test that groups are recomputed when another instance edits the file."""
+        storage1 = ConnectionStorage(temp_config)
+        storage2 = ConnectionStorage(temp_config)
+        assert storage2.get_groups() == []
+
+        storage1.add_connection(SSHConnection(name="S", host="h.com", user="u", group="Ops"))
+
+        assert storage2.get_groups() == ["Ops"]
+
     def test_load_empty_connections(self, storage):
         """Test loading when no connections exist."""
         loaded = storage.load_connections()
@@ -154,6 +189,108 @@ class TestConnectionStorage:
         assert len(loaded) == 1
         assert loaded[0].name == "Persistent"
 
+    def test_load_connections_uses_cache_when_file_unchanged(self, storage, monkeypatch):
+        """Test that repeated loads skip parsing while the file is unchanged."""
+        storage.save_connections([SSHConnection(name="Cached", host="h.com", user="u")])
+
+        def fail_load():
+            raise AssertionError("config file should not be re-parsed")
+
+        monkeypatch.setattr(storage, "_load_data", fail_load)
+        loaded = storage.load_connections()
+
+        assert [conn.name for conn in loaded] == ["Cached"]
+
+    def test_load_connections_reloads_after_external_change(self, temp_config):
+        """Test that edits made by another instance invalidate the cache."""
+        storage1 = ConnectionStorage(temp_config)
+        storage2 = ConnectionStorage(temp_config)
+        assert storage2.load_connections() == []
+
+        storage1.add_connection(SSHConnection(name="External", host="h.com", user="u"))
+        loaded = storage2.load_connections()
+
+        assert [conn.name for conn in loaded] == ["External"]
+
+    def test_read_connections_leaves_cache_to_adopt_connections(self, storage, monkeypatch):
+        """Parsing off the owning thread never touches the cache; adopting fills it."""
+        storage.save_connections([SSHConnection(name="Read", host="h.com", user="u")])
+        storage._clear_cache()
+
+        result = storage.read_connections()
+        assert storage._cache is None
+
+        assert [conn.name for conn in storage.adopt_connections(*result)] == ["Read"]
+        monkeypatch.setattr(storage, "_load_data", lambda: pytest.fail("should use the cache"))
+        assert [conn.name for conn in storage.load_connections()] == ["Read"]
+
+    def test_adopt_connections_rereads_a_file_changed_after_reading(self, temp_config):
+        """A background read that went stale before it was adopted is not cached."""
+        storage1 = ConnectionStorage(temp_config)
+        storage2 = ConnectionStorage(temp_config)
+        result = storage2.read_connections()
+
+        storage1.add_connection(SSHConnection(name="Newer", host="h.com", user="u"))
+
+        assert [conn.name for conn in storage2.adopt_connections(*result)] == ["Newer"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions and symlinks")
+    def test_save_keeps_file_mode_and_symlink(self, temp_config):
+        """Saving through a symlinked config keeps the link and the target's permissions."""
+        real_dir = temp_config.parent / "dotfiles"
+        real_dir.mkdir()
+        real_file = real_dir / "connections.json"
+        ConnectionStorage(real_file)
+        real_file.chmod(0o600)
+        temp_config.symlink_to(real_file)
+
+        storage = ConnectionStorage(temp_config)
+        storage.add_connection(SSHConnection(name="Linked", host="h.com", user="u"))
+
+        assert temp_config.is_symlink()
+        assert stat.S_IMODE(real_file.stat().st_mode) == 0o600
+        assert json.loads(real_file.read_text())["connections"][0]["name"] == "Linked"
+        assert list(real_dir.glob("*.tmp")) == []
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_new_config_file_is_owner_only(self, temp_config):
+        """A freshly created config, which may hold passwords, is not world-readable."""
+        ConnectionStorage(temp_config)
+
+        assert stat.S_IMODE(temp_config.stat().st_mode) == 0o600
+
+    def test_save_leaves_no_temp_file_and_keeps_original_on_failure(self, storage, monkeypatch):
+        """Test that saves are atomic and a failed write keeps the old file."""
+        storage.save_connections([SSHConnection(name="Original", host="h.com", user="u")])
+        assert list(storage.config_file.parent.glob("*.tmp")) == []
+
+        def fail_dumps(data):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("sshive.models.storage._dumps", fail_dumps)
+        with pytest.raises(RuntimeError):
+            storage.save_connections([SSHConnection(name="Broken", host="h.com", user="u")])
+
+        assert list(storage.config_file.parent.glob("*.tmp")) == []
+        with open(storage.config_file) as f:
+            assert json.load(f)["connections"][0]["name"] == "Original"
+
+    def test_failed_save_discards_in_place_edits_to_cached_connections(self, storage, monkeypatch):
+        """Cached objects edited before a failed save are not served as if saved."""
+        storage.save_connections([SSHConnection(name="Original", host="h.com", user="u")])
+        connections = storage.load_connections()
+        connections[0].name = "Edited"
+
+        def fail_dumps(data):
+            raise RuntimeError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr("sshive.models.storage._dumps", fail_dumps)
+            with pytest.raises(RuntimeError):
+                storage.save_connections(connections)
+
+        assert [conn.name for conn in storage.load_connections()] == ["Original"]
+
     def test_save_preserves_all_fields(self, storage):
         """Test that all connection fields are preserved."""
         conn = SSHConnection(
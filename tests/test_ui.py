@@ -2,13 +2,14 @@
 
 import json
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QLineEdit, QMessageBox
 from pytestqt.qtbot import QtBot
 
 from sshive.models.connection import SSHConnection
@@ -16,6 +17,7 @@ from sshive.models.storage import ConnectionStorage
 from sshive.ui.add_dialog import AddConnectionDialog
 from sshive.ui.main_window import MainWindow
 from sshive.ui.settings_dialog import SettingsDialog, _get_available_languages
+from sshive.ui.theme import ThemeManager
 
 
 class TestMainWindow:
@@ -90,6 +92,272 @@ class TestMainWindow:
         group_item = window.tree.topLevelItem(0)
         assert group_item.childCount() == 2
 
+    def test_background_load_populates_tree(self, window, temp_storage, qtbot: QtBot):
+        """Connections read on a pool thread are shown once the load reports back."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections_async()
+
+        qtbot.waitUntil(lambda: window.tree.topLevelItemCount() == 1)
+        assert window.tree.topLevelItem(0).child(0).text(0) == "Server1"
+
+    def test_loading_connections_prefetches_their_icons(self, window, temp_storage, monkeypatch):
+        """Loaded connections queue their icon downloads in one prefetch pass."""
+        temp_storage.add_connection(
+            SSHConnection(name="A", host="h.com", user="u", group="Work", icon="proxmox")
+        )
+        temp_storage.add_connection(SSHConnection(name="B", host="h.com", user="u", group="Work"))
+        prefetched = []
+        monkeypatch.setattr(
+            window.icon_manager, "fetch_icons", lambda names: prefetched.extend(names)
+        )
+
+        window._load_connections()
+
+        assert prefetched == ["proxmox"]
+
+    def test_background_load_adopts_cache_on_the_ui_thread(
+        self, window, temp_storage, qtbot: QtBot, monkeypatch
+    ):
+        """The pool thread only parses the file; the storage cache is filled on the UI thread."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        temp_storage._clear_cache()
+        threads = []
+        original_set_cache = temp_storage._set_cache
+        monkeypatch.setattr(
+            temp_storage,
+            "_set_cache",
+            lambda *args: (threads.append(threading.current_thread()), original_set_cache(*args)),
+        )
+        window._load_connections_async()
+
+        qtbot.waitUntil(lambda: window.tree.topLevelItemCount() == 1)
+        assert threads == [threading.main_thread()]
+
+    def test_ipc_command_on_cold_start_sees_loaded_connections(self, window, temp_storage):
+        """Commands handled before the background load finishes still see every connection."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections_async()
+        seen = []
+        window._show_quick_connect_dialog = lambda: seen.append(
+            [c.name for c in window.connections]
+        )
+
+        window.handle_ipc_command(["--quick-connect"])
+
+        assert seen == [["Server1"]]
+
+    def test_stale_background_load_is_ignored(self, window, temp_storage):
+        """A background load finishing after a newer load does not replace its result."""
+        stale_generation = window._load_generation
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections()
+
+        window._on_connections_loaded(stale_generation, [])
+
+        assert [c.name for c in window.connections] == ["Server1"]
+        assert window.tree.topLevelItemCount() == 1
+
+    def test_nested_groups_share_ancestor_items(self, window, temp_storage):
+        """Each group path gets one item, with a group's connections before its subgroups."""
+        for name, group in (("Api", "Work/Prod"), ("Lab", "Work/Dev"), ("Box", "Work")):
+            temp_storage.add_connection(
+                SSHConnection(name=name, host=f"{name}.com", user="u", group=group)
+            )
+        window._load_connections()
+
+        assert window.tree.topLevelItemCount() == 1
+        work = window.tree.topLevelItem(0)
+        assert [work.child(i).text(0) for i in range(work.childCount())] == ["Box", "Dev", "Prod"]
+        assert work.child(2).child(0).text(0) == "Api"
+
+    def test_connection_tooltip_is_built_on_first_hover(self, window, temp_storage):
+        """Tooltips are not formatted during populate, only when a row is hovered."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections()
+
+        assert window.tree.uniformRowHeights()
+        conn_item = window.tree.topLevelItem(0).child(0)
+        assert conn_item.toolTip(0) == ""
+
+        window._on_item_entered(conn_item, 0)
+        assert conn_item.toolTip(0) == "Server1 (user1@host1.com:22)"
+
+    def test_tree_reuses_themed_icons(self, window, temp_storage):
+        """Group and server icons come from the per-theme cache, not fresh renders."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections()
+
+        group_item = window.tree.topLevelItem(0)
+        assert group_item.icon(0).cacheKey() == window._icons["folder"].cacheKey()
+        assert group_item.child(0).icon(0).cacheKey() == window._icons["server"].cacheKey()
+
+    def test_switching_theme_back_reuses_rendered_icons(self, window):
+        """Returning to a theme reuses its icons instead of re-rendering the glyphs."""
+        window.settings.setValue("theme_preference", "Dark")
+        window._apply_theme()
+        dark_plus = window._icons["plus"]
+
+        window.settings.setValue("theme_preference", "Light")
+        window._apply_theme()
+        assert window._icons["plus"].cacheKey() != dark_plus.cacheKey()
+
+        window.settings.setValue("theme_preference", "Dark")
+        window._apply_theme()
+        assert window._icons["plus"].cacheKey() == dark_plus.cacheKey()
+
+    def test_repopulating_tree_resets_selection_buttons(self, window, temp_storage):
+        """Buttons follow the cleared selection even though tree signals are blocked."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="user1", group="Work")
+        )
+        window._load_connections()
+        window.tree.setCurrentItem(window.tree.topLevelItem(0).child(0))
+        assert window.edit_btn.isEnabled()
+
+        window._populate_tree()
+
+        assert window.tree.updatesEnabled()
+        assert not window.edit_btn.isEnabled()
+
+    def test_icon_loads_are_applied_in_one_batch(
+        self, window, temp_storage, qtbot: QtBot, monkeypatch
+    ):
+        """Several icon_loaded signals are folded into one deferred tree update."""
+        temp_storage.add_connection(
+            SSHConnection(name="A", host="a.com", user="u", group="Work", icon="alpha")
+        )
+        temp_storage.add_connection(
+            SSHConnection(name="B", host="b.com", user="u", group="Work", icon="beta")
+        )
+        window._load_connections()
+
+        icon_path = temp_storage.config_file.parent / "loaded-icon.png"
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.GlobalColor.blue)
+        assert pixmap.save(str(icon_path))
+        monkeypatch.setattr(window.icon_manager, "get_icon", lambda name: QIcon(str(icon_path)))
+
+        applied = []
+        original_apply = window._apply_pending_icon_loads
+
+        def spy_apply():
+            applied.append(dict(window._pending_icon_loads))
+            original_apply()
+
+        window._icon_load_timer.timeout.disconnect()
+        window._icon_load_timer.timeout.connect(spy_apply)
+
+        window._on_icon_loaded("alpha", str(icon_path))
+        window._on_icon_loaded("beta", str(icon_path))
+        qtbot.waitUntil(lambda: bool(applied))
+
+        assert applied == [{"alpha": str(icon_path), "beta": str(icon_path)}]
+        group_item = window.tree.topLevelItem(0)
+        for row in range(group_item.childCount()):
+            icon_key = group_item.child(row).icon(0).cacheKey()
+            assert icon_key != window._icons["server"].cacheKey()
+
+    def test_loaded_icon_is_shared_by_rows_with_the_same_name(
+        self, window, temp_storage, monkeypatch
+    ):
+        """Rows using the same dashboard icon get the icon manager's shared QIcon."""
+        for name in ("A", "B"):
+            temp_storage.add_connection(
+                SSHConnection(name=name, host="h.com", user="u", group="Work", icon="alpha")
+            )
+        window._load_connections()
+
+        icon_path = temp_storage.config_file.parent / "shared-icon.png"
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.GlobalColor.green)
+        assert pixmap.save(str(icon_path))
+        shared = QIcon(str(icon_path))
+        monkeypatch.setattr(
+            window.icon_manager, "get_icon", lambda name: shared if name == "alpha" else None
+        )
+
+        window._on_icon_loaded("alpha", str(icon_path))
+        window._apply_pending_icon_loads()
+
+        group_item = window.tree.topLevelItem(0)
+        first, second = group_item.child(0).icon(0), group_item.child(1).icon(0)
+        assert first.cacheKey() == second.cacheKey() == shared.cacheKey()
+        assert first.cacheKey() != window._icons["server"].cacheKey()
+
+    def test_search_filters_connections_and_groups(self, window, temp_storage, qtbot: QtBot):
+        """Typing narrows matches, deleting widens them, and empty groups are hidden."""
+        temp_storage.add_connection(
+            SSHConnection(name="Alpha", host="alpha.example", user="u", group="Work/Prod")
+        )
+        temp_storage.add_connection(
+            SSHConnection(name="Beta", host="beta.example", user="u", group="Home")
+        )
+        window._load_connections()
+
+        home, work = window.tree.topLevelItem(0), window.tree.topLevelItem(1)
+        prod = work.child(0)
+        alpha, beta = prod.child(0), home.child(0)
+
+        def search(text):
+            window.search_bar.setText(text)
+            qtbot.waitUntil(lambda: not window._search_timer.isActive())
+
+        search("al")
+        assert not alpha.isHidden() and beta.isHidden()
+        assert not work.isHidden() and not prod.isHidden() and home.isHidden()
+
+        search("alx")
+        assert alpha.isHidden() and work.isHidden() and prod.isHidden()
+
+        search("beta.ex")
+        assert alpha.isHidden() and not beta.isHidden() and not home.isHidden()
+
+        window.search_bar.setText("")
+        assert not any(item.isHidden() for item in (alpha, beta, home, work, prod))
+
+    def test_search_is_debounced_while_typing(self, window, temp_storage, qtbot: QtBot):
+        """A burst of keystrokes produces a single filter pass."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="host1.com", user="u", group="Work")
+        )
+        window._load_connections()
+
+        calls = []
+        original_apply = window._apply_search_filter
+        window._apply_search_filter = lambda text: (calls.append(text), original_apply(text))
+
+        for text in ("s", "se", "ser"):
+            window.search_bar.setText(text)
+        assert calls == []
+
+        qtbot.waitUntil(lambda: calls == ["ser"])
+
+    def test_search_index_reports_each_connection_once(self, window, temp_storage):
+        """A query hitting both name and host yields one row, and never spans fields."""
+        temp_storage.add_connection(
+            SSHConnection(name="web", host="web.example", user="u", group="A")
+        )
+        temp_storage.add_connection(
+            SSHConnection(name="db", host="db.example", user="u", group="B")
+        )
+        window._load_connections()
+
+        assert [row[0] for row in window._match_search_index("web")] == ["web"]
+        assert [row[0] for row in window._match_search_index("example")] == ["web", "db"]
+        assert window._match_search_index("bdb") == []
+
     def test_load_connections_with_custom_icon_path(self, window, temp_storage):
         """Custom icon file paths are used directly without icon manager fetch."""
         icon_path = temp_storage.config_file.parent / "custom-icon.png"
@@ -121,6 +389,32 @@ class TestMainWindow:
         conn_item = group_item.child(0)
         assert not conn_item.icon(0).isNull()
 
+    def test_rows_sharing_an_icon_resolve_it_once(self, window, temp_storage, monkeypatch):
+        """A custom icon used by several rows is probed and decoded once per rebuild."""
+        icon_path = temp_storage.config_file.parent / "shared-custom-icon.png"
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.GlobalColor.red)
+        assert pixmap.save(str(icon_path))
+
+        for name in ("A", "B", "C"):
+            temp_storage.add_connection(
+                SSHConnection(name=name, host="h.com", user="u", group="Work", icon=str(icon_path))
+            )
+
+        probes = []
+        original_probe = MainWindow._custom_icon_path
+        monkeypatch.setattr(
+            MainWindow,
+            "_custom_icon_path",
+            staticmethod(lambda value: (probes.append(value), original_probe(value))[1]),
+        )
+        window._load_connections()
+
+        assert probes == [str(icon_path)]
+        group_item = window.tree.topLevelItem(0)
+        keys = {group_item.child(i).icon(0).cacheKey() for i in range(3)}
+        assert len(keys) == 1
+
     def test_delete_connection_cleans_orphan_custom_icons(self, window, temp_storage, monkeypatch):
         """Deleting a connection removes unreferenced custom icon files."""
         custom_icons_dir = temp_storage.config_file.parent / "custom_icons"
@@ -177,6 +471,92 @@ class TestMainWindow:
         assert keep_icon.exists()
         assert not orphan_icon.exists()
 
+    def test_crud_updates_tree_in_place(self, window, temp_storage, monkeypatch):
+        """Add, edit and delete touch only the affected rows and keep groups tidy."""
+        for name, group in (("Alpha", "Work"), ("Gamma", "Work"), ("Home1", "Home")):
+            temp_storage.add_connection(
+                SSHConnection(name=name, host=f"{name}.com", user="u", group=group)
+            )
+        window._load_connections()
+        home_item = window.tree.topLevelItem(0)
+
+        def rebuild_forbidden():
+            raise AssertionError("tree should not be rebuilt")
+
+        monkeypatch.setattr(window, "_build_tree", rebuild_forbidden)
+        monkeypatch.setattr(window.storage, "load_connections", rebuild_forbidden)
+
+        beta = SSHConnection(name="Beta", host="beta.com", user="u", group="Work")
+        window._on_connection_added(beta)
+        work = window.tree.topLevelItem(1)
+        assert [work.child(i).text(0) for i in range(work.childCount())] == [
+            "Alpha",
+            "Beta",
+            "Gamma",
+        ]
+
+        # Moving the only Home connection into Work drops the empty Home group
+        home1 = home_item.child(0).data(0, Qt.ItemDataRole.UserRole)
+        home1.group = "Work"
+        window._on_connection_updated(home1)
+        assert window.tree.topLevelItemCount() == 1
+        assert "Home" not in window._group_items
+        assert window.tree.topLevelItem(0).childCount() == 4
+
+        window._on_connection_deleted(beta.id)
+        assert beta.id not in window._conn_id_to_item
+        assert [c.name for c in window.connections] == ["Alpha", "Gamma", "Home1"]
+        assert [row[0] for row in window._match_search_index("a")] == ["alpha", "gamma"]
+
+    def test_deleting_a_duplicated_id_removes_every_row(self, window, temp_storage):
+        """Connections sharing an id (left behind by imports) all leave the tree on delete."""
+        alpha = SSHConnection(name="Alpha", host="a.com", user="u", group="Work")
+        twin = SSHConnection.from_dict({**alpha.to_dict(), "name": "Beta"})
+        gamma = SSHConnection(name="Gamma", host="c.com", user="u", group="Work")
+        temp_storage.save_connections([alpha, twin, gamma])
+        window._load_connections()
+
+        # Editing one twin keeps the other row
+        edited = window.connections[0]
+        edited.name = "Alpha2"
+        temp_storage.update_connection(edited)
+        window._on_connection_updated(edited)
+        group_item = window.tree.topLevelItem(0)
+        names = sorted(group_item.child(i).text(0) for i in range(group_item.childCount()))
+        assert names == ["Alpha2", "Beta", "Gamma"]
+
+        temp_storage.delete_connection(alpha.id)
+        window._on_connection_deleted(alpha.id)
+
+        group_item = window.tree.topLevelItem(0)
+        assert [group_item.child(i).text(0) for i in range(group_item.childCount())] == ["Gamma"]
+        assert [c.name for c in window.connections] == ["Gamma"]
+
+    def test_crud_into_new_group_rebuilds_tree(self, window, temp_storage):
+        """A connection in a group that does not exist yet falls back to a rebuild."""
+        window._load_connections()
+        window._on_connection_added(
+            SSHConnection(name="Solo", host="solo.com", user="u", group="New/Sub")
+        )
+
+        new_group = window.tree.topLevelItem(0)
+        assert new_group.text(0) == "New"
+        assert new_group.child(0).child(0).text(0) == "Solo"
+
+    def test_grouping_is_reused_until_connections_change(self, window, temp_storage):
+        """Repopulating reuses the grouped connections; edits regroup them."""
+        temp_storage.add_connection(SSHConnection(name="A", host="a.com", user="u", group="Work"))
+        window._load_connections()
+        grouped = window._grouped_connections()
+
+        window._populate_tree()
+        assert window._grouped_connections() is grouped
+
+        window._on_connection_added(SSHConnection(name="B", host="b.com", user="u"))
+        regrouped = window._grouped_connections()
+        assert regrouped is not grouped
+        assert [c.name for c in regrouped["Default"]] == ["B"]
+
     def test_edit_connection_cleans_replaced_custom_icon(self, window, temp_storage, monkeypatch):
         """Editing a connection icon removes the previously referenced custom icon file."""
         custom_icons_dir = temp_storage.config_file.parent / "custom_icons"
@@ -371,6 +751,41 @@ class TestMainWindow:
         assert group_item.text(0) == "Real Group"
         assert conn_item.text(0) == "Real Server"
 
+    def test_incognito_connections_are_loaded_once_per_session(self, window, monkeypatch):
+        """Toggling incognito again reuses the fake connections already in memory."""
+        calls = []
+        original_load = window._load_or_generate_incognito_connections
+        monkeypatch.setattr(
+            window,
+            "_load_or_generate_incognito_connections",
+            lambda: (calls.append(1), original_load())[1],
+        )
+
+        window._toggle_incognito_mode()
+        first = window.connections
+        window._toggle_incognito_mode()
+        window._toggle_incognito_mode()
+
+        assert len(calls) == 1
+        assert [c.id for c in window.connections] == [c.id for c in first]
+
+    def test_background_load_finishing_in_incognito_keeps_fake_tree(
+        self, window, temp_storage, qtbot: QtBot
+    ):
+        """Real connections loaded while incognito is on are held back until it is turned off."""
+        temp_storage.add_connection(
+            SSHConnection(name="Server1", host="secret.example.com", user="user1", group="Work")
+        )
+        window._load_connections_async()
+        window._toggle_incognito_mode()
+
+        qtbot.waitUntil(lambda: window._load_task is None)
+        assert all(c.host != "secret.example.com" for c in window.connections)
+
+        window._toggle_incognito_mode()
+        assert [c.name for c in window.connections] == ["Server1"]
+        assert window.tree.topLevelItemCount() == 1
+
     def test_incognito_mode_port_randomization(self, window, temp_storage, qtbot: QtBot):
         """Test that incognito mode randomizes ports."""
         # Add connection with standard SSH port
@@ -419,7 +834,9 @@ class TestMainWindow:
         assert len(recent) == 1
         assert recent[0]["id"] == conn.id
 
-    def test_connect_host_key_mismatch_prompts_and_retries(self, window, temp_storage, monkeypatch):
+    def test_connect_host_key_mismatch_prompts_and_retries(
+        self, window, temp_storage, monkeypatch, qtbot: QtBot
+    ):
         """A host-key mismatch prompts trust flow, updates known_hosts, and retries auth."""
         conn = SSHConnection(
             name="Seedbox",
@@ -452,15 +869,49 @@ class TestMainWindow:
             "sshive.ui.main_window.QMessageBox.question",
             lambda *args, **kwargs: QMessageBox.StandardButton.Yes,
         )
+        launched = []
         monkeypatch.setattr(
-            "sshive.ui.main_window.SSHLauncher.launch", lambda connection, **kwargs: True
+            "sshive.ui.main_window.SSHLauncher.launch",
+            lambda connection, **kwargs: launched.append(connection) or True,
         )
 
         group_item = window.tree.topLevelItem(0)
         conn_item = group_item.child(0)
         window._connect_to_server(conn_item)
 
+        # The check runs on a pool thread; the launch follows once it reports back
+        qtbot.waitUntil(lambda: bool(launched))
         assert attempts["count"] == 2
+        assert not window._credential_checks
+
+    def test_connect_reports_failed_credentials_without_launching(
+        self, window, monkeypatch, qtbot: QtBot
+    ):
+        """A failed background credential check shows an error and skips the launch."""
+        conn = SSHConnection(name="Box", host="box.example.com", user="root", password="pw")
+
+        monkeypatch.setattr(
+            "sshive.ui.main_window.SSHLauncher.test_connection", lambda connection: (True, None)
+        )
+        monkeypatch.setattr(
+            "sshive.ui.main_window.SSHLauncher.check_credentials",
+            lambda connection: (False, "Permission denied"),
+        )
+        errors = []
+        monkeypatch.setattr(
+            "sshive.ui.main_window.QMessageBox.critical",
+            lambda *args, **kwargs: errors.append(args[2]),
+        )
+        monkeypatch.setattr(
+            "sshive.ui.main_window.SSHLauncher.launch",
+            lambda connection, **kwargs: pytest.fail("should not launch"),
+        )
+
+        window._connect_with_connection(conn)
+        qtbot.waitUntil(lambda: bool(errors))
+
+        assert "Permission denied" in errors[0]
+        assert not window._credential_checks
 
     def test_connect_skips_recent_history_when_disabled(self, window, temp_storage, monkeypatch):
         """History is not recorded when save_recent_history setting is disabled."""
@@ -610,6 +1061,23 @@ class TestMainWindow:
 
         assert temp_storage.get_recent_connections() == []
 
+    def test_column_state_is_only_written_when_changed(self, window, monkeypatch):
+        """Saving an unchanged header state does not touch QSettings again."""
+        writes = []
+        original_set_value = window.settings.setValue
+        monkeypatch.setattr(
+            window.settings,
+            "setValue",
+            lambda key, value: (writes.append(key), original_set_value(key, value)),
+        )
+
+        window._save_column_state()
+        window._save_column_state()
+        assert writes == ["columnState"]
+
+        window._hide_column(2)
+        assert writes == ["columnState", "columnState"]
+
 
 class TestAddConnectionDialog:
     """Test cases for AddConnectionDialog."""
@@ -640,6 +1108,40 @@ class TestAddConnectionDialog:
         """Test that default group is 'Default'."""
         assert dialog.group_input.currentText() == "Default"
 
+    def test_icon_preview_is_debounced_while_typing(self, dialog, qtbot: QtBot):
+        """Typing an icon name refreshes the preview once, after input settles."""
+        with patch.object(dialog, "_update_icon_preview") as mock_update:
+            for prefix in ("p", "pr", "pro", "proxmox"):
+                dialog.icon_input.setText(prefix)
+            mock_update.assert_not_called()
+
+            qtbot.waitUntil(lambda: mock_update.called, timeout=1000)
+
+        mock_update.assert_called_once_with("proxmox")
+
+    def test_icon_input_is_lowercased_in_a_single_pass(self, dialog, qtbot: QtBot):
+        """Uppercase icon names are lowercased without a second textChanged round-trip."""
+        emitted = []
+        dialog.icon_input.textChanged.connect(emitted.append)
+        with patch.object(dialog, "_update_icon_preview") as mock_update:
+            dialog.icon_input.setText("ProxMox")
+            assert dialog.icon_input.text() == "proxmox"
+            assert emitted == ["ProxMox"]
+
+            qtbot.waitUntil(lambda: mock_update.called, timeout=1000)
+
+        mock_update.assert_called_once_with("proxmox")
+
+    def test_password_toggle_reuses_rendered_icons(self, dialog):
+        """Toggling password visibility swaps echo mode without re-rendering icons."""
+        with patch("sshive.ui.add_dialog.qta.icon") as mock_icon:
+            dialog._toggle_password_visibility()
+            assert dialog.password_input.echoMode() == QLineEdit.EchoMode.Normal
+            dialog._toggle_password_visibility()
+            assert dialog.password_input.echoMode() == QLineEdit.EchoMode.Password
+
+        mock_icon.assert_not_called()
+
     def test_get_connection_with_valid_data(self, dialog, qtbot: QtBot):
         """Test getting connection with valid input."""
         dialog.name_input.setText("Test Server")
@@ -1007,3 +1509,47 @@ class TestSettingsDialog:
             # Revert
             dialog.lang_combo.setCurrentIndex(original_index)
             assert dialog.lang_restart_label.isHidden()
+
+
+class TestThemeManager:
+    """Tests for ThemeManager."""
+
+    def test_reapplying_the_current_theme_is_skipped(self, qapp):
+        """Applying the theme already in use leaves the stylesheet alone."""
+        ThemeManager._current = None
+        try:
+            ThemeManager.apply_dark_theme(qapp)
+            assert qapp.styleSheet()
+
+            qapp.setStyleSheet("")
+            ThemeManager.apply_dark_theme(qapp)
+            assert qapp.styleSheet() == ""
+
+            ThemeManager.apply_light_theme(qapp)
+            assert "QTreeView" in qapp.styleSheet()
+        finally:
+            ThemeManager._current = None
+            ThemeManager.apply_theme(qapp)
+
+    def test_system_dark_mode_is_cached_until_scheme_changes(self, qapp, monkeypatch):
+        """Detection runs once, and again only after the system colour scheme changes."""
+        calls = []
+
+        def fake_detect():
+            calls.append(True)
+            return True
+
+        monkeypatch.setattr(ThemeManager, "_system_dark", None)
+        monkeypatch.setattr(ThemeManager, "_detect_system_dark_mode", staticmethod(fake_detect))
+
+        assert ThemeManager.is_system_dark_mode()
+        assert ThemeManager.is_system_dark_mode()
+        assert len(calls) == 1
+
+        changed = []
+        ThemeManager.color_scheme_watcher().changed.connect(lambda: changed.append(True))
+        ThemeManager.color_scheme_watcher()._on_color_scheme_changed()
+
+        assert changed == [True]
+        assert ThemeManager.is_system_dark_mode()
+        assert len(calls) == 2